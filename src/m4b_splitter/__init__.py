@@ -29,62 +29,84 @@ Requirements:
     - ffmpeg and ffprobe installed and in PATH
 """
 
+import importlib
+
 __version__ = "1.2.0"
 __author__ = "M4B Splitter Contributors"
 
-from m4b_splitter.dependencies import (
-    DependencyCheckResult,
-    DependencyStatus,
-    OSType,
-    check_dependencies,
-    ensure_dependencies,
-    format_dependency_check,
-    require_dependencies,
-)
-from m4b_splitter.models import AudioMetadata, Chapter, SplitPart, SplitResult
-from m4b_splitter.probe import (
-    ProbeError,
-    extract_chapters,
-    extract_metadata,
-    get_duration,
-    probe_file,
-    validate_m4b_file,
-)
-from m4b_splitter.progress import (
-    ConsoleProgress,
-    ProgressCallback,
-    ProgressStep,
-    ProgressTracker,
-    ProgressUpdate,
-    SilentProgress,
-)
-from m4b_splitter.splitter import (
-    IPOD_PRESETS,
-    FFmpegProgress,
-    IPodSettings,
-    M4BSplitter,
-    SplitterError,
-    format_time_human,
-    split_m4b,
-)
+# Lazy re-exports (PEP 562): importing the package binds nothing but the
+# version metadata, so e.g. `m4b-splitter --version` doesn't pay for the
+# subprocess/probe machinery. Attributes are resolved on first access.
+_LAZY_IMPORTS = {
+    # Dependency checking
+    "DependencyCheckResult": "m4b_splitter.dependencies",
+    "DependencyStatus": "m4b_splitter.dependencies",
+    "OSType": "m4b_splitter.dependencies",
+    "check_dependencies": "m4b_splitter.dependencies",
+    "ensure_dependencies": "m4b_splitter.dependencies",
+    "format_dependency_check": "m4b_splitter.dependencies",
+    "require_dependencies": "m4b_splitter.dependencies",
+    # Models
+    "AudioMetadata": "m4b_splitter.models",
+    "Chapter": "m4b_splitter.models",
+    "SplitPart": "m4b_splitter.models",
+    "SplitResult": "m4b_splitter.models",
+    # Probe functions
+    "ProbeError": "m4b_splitter.probe",
+    "extract_chapters": "m4b_splitter.probe",
+    "extract_metadata": "m4b_splitter.probe",
+    "get_duration": "m4b_splitter.probe",
+    "probe_all": "m4b_splitter.probe",
+    "probe_file": "m4b_splitter.probe",
+    "validate_m4b_file": "m4b_splitter.probe",
+    # Progress tracking
+    "ConsoleProgress": "m4b_splitter.progress",
+    "ProgressCallback": "m4b_splitter.progress",
+    "ProgressStep": "m4b_splitter.progress",
+    "ProgressTracker": "m4b_splitter.progress",
+    "ProgressUpdate": "m4b_splitter.progress",
+    "SILENT_PROGRESS": "m4b_splitter.progress",
+    "SilentProgress": "m4b_splitter.progress",
+    # Splitter
+    "IPOD_PRESETS": "m4b_splitter.splitter",
+    "FFmpegProgress": "m4b_splitter.splitter",
+    "IPodSettings": "m4b_splitter.splitter",
+    "M4BSplitter": "m4b_splitter.splitter",
+    "SplitterError": "m4b_splitter.splitter",
+    "format_time_human": "m4b_splitter.splitter",
+    "split_m4b": "m4b_splitter.splitter",
+}
 
-__all__ = [
+
+def __getattr__(name: str):
+    """Resolve lazily exported attributes on first access."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache so subsequent lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+__all__ = (
     "IPOD_PRESETS",
+    "SILENT_PROGRESS",
     "AudioMetadata",
-    # Models
     "Chapter",
     "ConsoleProgress",
     "DependencyCheckResult",
     "DependencyStatus",
     "FFmpegProgress",
-    # iPod settings
     "IPodSettings",
-    # Splitter
     "M4BSplitter",
     "OSType",
     "ProbeError",
     "ProgressCallback",
-    # Progress tracking
     "ProgressStep",
     "ProgressTracker",
     "ProgressUpdate",
@@ -92,9 +114,7 @@ __all__ = [
     "SplitPart",
     "SplitResult",
     "SplitterError",
-    # Version
     "__version__",
-    # Dependency checking
     "check_dependencies",
     "ensure_dependencies",
     "extract_chapters",
@@ -102,9 +122,9 @@ __all__ = [
     "format_dependency_check",
     "format_time_human",
     "get_duration",
-    # Probe functions
+    "probe_all",
     "probe_file",
     "require_dependencies",
     "split_m4b",
     "validate_m4b_file",
-]
+)
@@ -1,451 +1,302 @@
-# ruff: noqa: B008
-"""Command-line interface for M4B splitter."""
-# we will ignore Ruff B008 here because of how Typer handles args
-
-import sys
-from enum import Enum
-from pathlib import Path
-
-# Try to import typer and rich, fall back to basic CLI if not available
-try:
-    import typer
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.progress import (
-        BarColumn,
-        Progress,
-        SpinnerColumn,
-        TaskProgressColumn,
-        TextColumn,
-        TimeElapsedColumn,
-        TimeRemainingColumn,
-    )
-    from rich.table import Table
-    from rich.text import Text
-
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-    typer = None  # type: ignore
-
-from m4b_splitter import (
-    IPOD_PRESETS,
-    FFmpegProgress,
-    M4BSplitter,
-    format_time_human,
-)
-from m4b_splitter.dependencies import check_dependencies, format_dependency_check
+"""Command-line interface for M4B splitter.
 
+Only standard-library modules are imported here; the rich/typer CLI lives in
+:mod:`m4b_splitter.rich_cli` and is loaded on demand, so cheap invocations
+(``--version``, or any run on an install without rich) never pay for it.
+"""
 
+import contextlib
+import functools
+import queue
+import sys
+import threading
+import time
+from importlib.util import find_spec
+
+# Probe for typer/rich without executing them; the actual imports happen in
+# rich_cli only when the rich code path is taken.
+RICH_AVAILABLE = find_spec("typer") is not None and find_spec("rich") is not None
+
+
+def _scan_number(s: str, i: int) -> tuple[float, int]:
+    """Scan a decimal number starting at index i; return (value, next index).
+
+    Builds an integer mantissa and divides by the fractional scale once,
+    avoiding a substring allocation plus float() reparse.
+    """
+    n = len(s)
+    mantissa = 0
+    digits = 0
+    while i < n and "0" <= s[i] <= "9":
+        mantissa = mantissa * 10 + (ord(s[i]) - 48)
+        digits += 1
+        i += 1
+    scale = 1
+    if i < n and s[i] == ".":
+        i += 1
+        frac = 0
+        while i < n and "0" <= s[i] <= "9":
+            mantissa = mantissa * 10 + (ord(s[i]) - 48)
+            scale *= 10
+            frac += 1
+            i += 1
+        if frac == 0:
+            raise ValueError("trailing decimal point")
+        # A bare leading point (".5") is fine as long as there are
+        # fractional digits
+        digits += frac
+    if digits == 0:
+        raise ValueError("expected a number")
+    return mantissa / scale, i
+
+
+def _scan_duration(s: str) -> float:
+    """Single-pass scan of a normalized (stripped, lowercased) duration."""
+    n = len(s)
+    i = 0
+    sign = 1.0
+    if i < n and (s[i] == "+" or s[i] == "-"):
+        if s[i] == "-":
+            sign = -1.0
+        i += 1
+    value, i = _scan_number(s, i)
+    if i == n:
+        # Plain hours: "8", "4.5", "-8"
+        return sign * value
+    unit = s[i]
+    i += 1
+    if unit == "m":
+        if i != n:
+            raise ValueError("trailing characters after minutes")
+        return sign * (value / 60)
+    if unit != "h":
+        raise ValueError(f"unknown unit {unit!r}")
+    if i == n:
+        # Hours with suffix: "8h", "4.5h", "-5h"
+        return sign * value
+    # Combined form: "2h30m"; a space between the components ("2h 30m")
+    # is tolerated, as the float-fallback parser before this one was
+    while i < n and s[i] == " ":
+        i += 1
+    minutes, i = _scan_number(s, i)
+    if i == n - 1 and s[i] == "m":
+        return sign * (value + minutes / 60)
+    raise ValueError("expected 'm' after minutes")
+
+
+@functools.lru_cache(maxsize=128)
 def parse_duration(duration_str: str) -> float:
-    """Parse a duration string into hours."""
-    duration_str = duration_str.strip().lower()
-
+    """Parse a duration string into hours.
+
+    Accepts plain hours ("8", "4.5", "-8") or suffixed forms ("8h",
+    "90m", "2h30m"). Implemented as a single-pass character scan — no
+    regex engine, no intermediate substrings. Cached on the raw string
+    since the same handful of values ("8h", "90m") recur.
+    """
+    s = duration_str.strip().lower()
+    # No real duration needs more than 16 chars; rejecting early keeps
+    # pathological inputs from growing an arbitrarily large mantissa
+    if len(s) > 16:
+        raise ValueError(f"Invalid duration format: {duration_str}")
     try:
-        return float(duration_str)
+        return _scan_duration(s)
     except ValueError:
-        pass
+        raise ValueError(f"Invalid duration format: {duration_str}") from None
 
-    if duration_str.endswith("h") and "m" not in duration_str:
-        try:
-            return float(duration_str[:-1])
-        except ValueError:
-            pass
 
-    if duration_str.endswith("m") and "h" not in duration_str:
-        try:
-            return float(duration_str[:-1]) / 60
-        except ValueError:
-            pass
-
-    if "h" in duration_str and "m" in duration_str:
-        try:
-            parts = duration_str.replace("m", "").split("h")
-            hours = float(parts[0])
-            minutes = float(parts[1]) if parts[1] else 0
-            return hours + minutes / 60
-        except (ValueError, IndexError):
-            pass
+def _offer_latest(updates: queue.Queue, state: tuple) -> None:
+    """
+    Put a progress state on a bounded queue with last-writer-wins semantics.
 
-    raise ValueError(f"Invalid duration format: {duration_str}")
+    Never blocks the caller (the ffmpeg pipe reader loop); if the queue is
+    full, the stale state is dropped in favor of the new one.
+    """
+    try:
+        updates.put_nowait(state)
+    except queue.Full:
+        with contextlib.suppress(queue.Empty):
+            updates.get_nowait()
+        with contextlib.suppress(queue.Full):
+            updates.put_nowait(state)
 
 
 # ============================================================================
-# Rich/Typer CLI (when dependencies are available)
+# Fallback CLI (when typer/rich not available)
 # ============================================================================
 
-if RICH_AVAILABLE:
+# Prebuilt progress bar halves; each update just slices these.
+_BAR_FULL = "=" * 50
+_BAR_EMPTY = " " * 50
+
+
+def fallback_main() -> int:
+    """Fallback CLI using argparse."""
+    import argparse
+    from pathlib import Path
 
-    class PresetChoice(str, Enum):
-        standard = "standard"
-        high = "high"
-        extended = "extended"
-        video = "video"
+    from m4b_splitter import IPOD_PRESETS, FFmpegProgress, M4BSplitter
+    from m4b_splitter.dependencies import check_dependencies, format_dependency_check
 
-    app = typer.Typer(
-        name="m4b-splitter",
-        help="Split M4B audiobook files by chapter at specified duration limits.",
-        add_completion=False,
-        rich_markup_mode="rich",
+    parser = argparse.ArgumentParser(
+        prog="m4b-splitter", description="Split M4B audiobook files by chapter."
     )
 
-    console = Console()
-
-    def print_presets_table() -> None:
-        table = Table(title="iPod Encoding Presets", show_header=True, header_style="bold cyan")
-        table.add_column("Preset", style="green")
-        table.add_column("Sample Rate")
-        table.add_column("Bitrate")
-        table.add_column("Channels")
-        table.add_column("Mode")
-        table.add_column("Max Duration", style="yellow")
-        table.add_column("Best For")
-
-        preset_info = {
-            "standard": (
-                "22050 Hz",
-                "64 kbps",
-                "Mono",
-                "VBR",
-                "~55h",
-                "Most audiobooks",
-            ),
-            "high": (
-                "44100 Hz",
-                "128 kbps",
-                "Stereo",
-                "VBR",
-                "~27h",
-                "Music/High quality",
-            ),
-            "extended": (
-                "16000 Hz",
-                "48 kbps",
-                "Mono",
-                "VBR",
-                "~74h",
-                "Very long books",
-            ),
-            "video": (
-                "44100 Hz",
-                "80 kbps",
-                "Mono",
-                "CBR",
-                "~27h",
-                "iPod Video (5th Gen)",
-            ),
-        }
-
-        for name, info in preset_info.items():
-            table.add_row(name, *info)
-
-        console.print(table)
-
-    @app.command()
-    def check() -> None:
-        """Check if ffmpeg/ffprobe are installed."""
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("check", help="Check ffmpeg installation")
+    subparsers.add_parser("presets", help="Show iPod presets")
+
+    split_parser = subparsers.add_parser("split", help="Split an M4B file")
+    split_parser.add_argument("input_file", type=Path, help="Input M4B file")
+    split_parser.add_argument("-o", "--output", type=Path, help="Output directory")
+    split_parser.add_argument("-d", "--duration", default="8h")
+    split_parser.add_argument("-p", "--pattern", default="{title} - Part {part} of {total}.m4b")
+    split_parser.add_argument("--ipod", action="store_true")
+    split_parser.add_argument("--preset", default="standard", choices=list(IPOD_PRESETS.keys()))
+    split_parser.add_argument("-j", "--jobs", type=int, default=1)
+    split_parser.add_argument("--threads", type=int, default=0)
+    split_parser.add_argument("--hwaccel", default=None)
+
+    parser.add_argument("-v", "--version", action="store_true")
+
+    args = parser.parse_args()
+
+    if args.version:
+        from m4b_splitter import __version__
+
+        print(f"m4b-splitter version {__version__}")
+        return 0
+
+    if args.command == "check":
         result = check_dependencies()
+        print(format_dependency_check(result))
+        return 0 if result.all_found else 1
 
-        if result.all_found:
-            content = Text()
-            content.append("✓ ", style="green bold")
-            content.append("All dependencies found!\n\n", style="green")
-            content.append(f"OS: {result.os_name}\n\n", style="dim")
-            content.append(f"ffmpeg:  {result.ffmpeg.path}\n", style="cyan")
-            content.append(f"ffprobe: {result.ffprobe.path}\n", style="cyan")
-            console.print(Panel(content, title="Dependency Check", border_style="green"))
-        else:
-            console.print(format_dependency_check(result))
-            raise typer.Exit(1)
-
-    @app.command()
-    def presets() -> None:
-        """Show available iPod encoding presets."""
-        print_presets_table()
-
-    @app.command()
-    def split(
-        input_file: Path = typer.Argument(..., help="Input M4B file to split", exists=True),
-        output_dir: Path = typer.Option(None, "--output", "-o", help="Output directory"),
-        max_duration: str = typer.Option("8h", "--duration", "-d", help="Max duration per part"),
-        pattern: str = typer.Option("{title} - Part {part} of {total}.m4b", "--pattern", "-p"),
-        ipod: bool = typer.Option(False, "--ipod", help="Re-encode for iPod compatibility"),
-        ipod_preset: PresetChoice = typer.Option(PresetChoice.standard, "--preset"),
-    ) -> None:
-        """Split an M4B audiobook file into smaller parts."""
+    elif args.command == "presets":
+        print("\niPod Encoding Presets:")
+        for name, settings in IPOD_PRESETS.items():
+            print(f"  {name}: {settings}")
+        return 0
+
+    elif args.command == "split":
         dep_result = check_dependencies()
         if not dep_result.all_found:
-            console.print("[red]Error:[/red] ffmpeg/ffprobe not found!")
-            console.print(format_dependency_check(dep_result))
-            raise typer.Exit(1)
+            print("Error: ffmpeg/ffprobe not found!")
+            return 1
 
         try:
-            max_hours = parse_duration(max_duration)
-            if max_hours <= 0:
-                console.print("[red]Error:[/red] Duration must be positive")
-                raise typer.Exit(1)
+            max_hours = parse_duration(args.duration)
         except ValueError as e:
-            console.print(f"[red]Error:[/red] {e}")
-            raise typer.Exit(1) from e
-
-        if output_dir is None:
-            output_dir = input_file.parent
-
-        ipod_settings = IPOD_PRESETS.get(ipod_preset.value) if ipod else None
-
-        # Configuration display
-        config_text = Text()
-        config_text.append("Input:        ", style="dim")
-        config_text.append(f"{input_file.name}\n", style="cyan")
-        config_text.append("Output Dir:   ", style="dim")
-        config_text.append(f"{output_dir}\n", style="cyan")
-        config_text.append("Max Duration: ", style="dim")
-        config_text.append(
-            f"{max_hours:.2f} hours ({format_time_human(max_hours * 3600)})\n",
-            style="yellow",
+            print(f"Error: {e}")
+            return 1
+
+        output_dir = args.output or args.input_file.parent
+
+        print(f"\nSplitting: {args.input_file}")
+        print(f"Output:    {output_dir}")
+        print(f"Max:       {max_hours:.2f} hours")
+        if args.ipod:
+            print(f"iPod:      {args.preset}")
+
+        # Terminal writes happen on a separate thread so the ffmpeg pipe
+        # reader is never blocked waiting on stdout.
+        updates: queue.Queue = queue.Queue(maxsize=1)
+        done = threading.Event()
+
+        def drain_updates() -> None:
+            # The flush dominates per-update cost; cap writes to 10/s
+            # (faster than the eye can follow anyway). A state arriving
+            # inside the interval is held, not dropped, so the last bar
+            # position always gets rendered once the interval elapses
+            # or the split finishes.
+            last_write = 0.0
+            pending: tuple[str, float] | None = None
+            while not (done.is_set() and updates.empty() and pending is None):
+                with contextlib.suppress(queue.Empty):
+                    pending = updates.get(timeout=0.03)
+                if pending is None:
+                    continue
+                now = time.monotonic()
+                if now - last_write < 0.1 and not done.is_set():
+                    continue
+                last_write = now
+                step, percent = pending
+                pending = None
+                filled = int(percent / 2)
+                bar = _BAR_FULL[:filled] + _BAR_EMPTY[filled:]
+                print(f"\r[{bar}] {percent:5.1f}% {step}", end="", flush=True)
+
+        def progress_cb(step: str, percent: float, _: FFmpegProgress | None):
+            _offer_latest(updates, (step, percent))
+
+        render_thread = threading.Thread(target=drain_updates, daemon=True)
+        render_thread.start()
+
+        splitter = M4BSplitter()
+        result = splitter.split(
+            input_file=args.input_file,
+            output_dir=output_dir,
+            max_duration_hours=max_hours,
+            output_pattern=args.pattern,
+            ipod_mode=args.ipod,
+            ipod_preset=args.preset,
+            progress_callback=progress_cb,
+            jobs=args.jobs,
+            ffmpeg_threads=args.threads,
+            hwaccel=args.hwaccel,
         )
 
-        if ipod and ipod_settings:
-            config_text.append("iPod Mode:    ", style="dim")
-            config_text.append("Enabled\n", style="green")
-            config_text.append("Preset:       ", style="dim")
-            config_text.append(f"{ipod_preset.value}\n", style="green")
-            config_text.append("Encoding:     ", style="dim")
-            config_text.append(
-                f"{ipod_settings.sample_rate}Hz, {ipod_settings.bitrate}kbps, "
-                f"{'mono' if ipod_settings.channels == 1 else 'stereo'}"
-                f"{', CBR' if ipod_settings.use_cbr else ''}\n",
-                style="cyan",
-            )
-        else:
-            config_text.append("iPod Mode:    ", style="dim")
-            config_text.append("Disabled (stream copy)\n", style="dim")
-
-        console.print(Panel(config_text, title="Configuration", border_style="blue"))
-        console.print()
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold blue]{task.description}"),
-            BarColumn(bar_width=40),
-            TaskProgressColumn(),
-            TimeElapsedColumn(),
-            TimeRemainingColumn(),
-            console=console,
-            transient=False,
-        ) as progress:
-            main_task = progress.add_task("Splitting audiobook...", total=100)
-            ffmpeg_task = progress.add_task("[cyan]Waiting...", total=100, visible=False)
-
-            def progress_callback(
-                step: str, percent: float, ffmpeg_prog: FFmpegProgress | None
-            ) -> None:
-                progress.update(main_task, completed=percent, description=f"[bold blue]{step}")
-
-                if ffmpeg_prog and ffmpeg_prog.percent > 0:
-                    progress.update(ffmpeg_task, visible=True)
-                    details = []
-                    if ffmpeg_prog.speed > 0:
-                        details.append(f"{ffmpeg_prog.speed:.1f}x")
-                    if ffmpeg_prog.bitrate_kbps > 0:
-                        details.append(f"{ffmpeg_prog.bitrate_kbps:.0f}kbps")
-                    if ffmpeg_prog.size_kb > 0:
-                        details.append(f"{ffmpeg_prog.size_kb / 1024:.1f}MB")
-
-                    detail_str = " | ".join(details) if details else ""
-                    time_str = format_time_human(ffmpeg_prog.time_seconds)
-
-                    progress.update(
-                        ffmpeg_task,
-                        completed=ffmpeg_prog.percent,
-                        description=f"[cyan]  └─ {time_str} encoded {detail_str}",
-                    )
-                elif "Processing" not in step and "Encoding" not in step:
-                    progress.update(ffmpeg_task, visible=False)
-
-            splitter = M4BSplitter()
-            result = splitter.split(
-                input_file=input_file,
-                output_dir=output_dir,
-                max_duration_hours=max_hours,
-                output_pattern=pattern,
-                ipod_mode=ipod,
-                ipod_preset=ipod_preset.value,
-                progress_callback=progress_callback,
-            )
-
-            progress.update(ffmpeg_task, visible=False)
-            progress.update(main_task, completed=100)
-
-        console.print()
+        done.set()
+        render_thread.join(timeout=2)
+        print("\n")
 
         if result.success:
             if result.parts:
-                result_table = Table(
-                    title="✓ Split Complete",
-                    show_header=True,
-                    header_style="bold green",
-                )
-                result_table.add_column("Part", style="cyan", justify="center")
-                result_table.add_column("Duration", justify="right")
-                result_table.add_column("Chapters", justify="center")
-                result_table.add_column("File")
-
+                print(f"Success! Created {len(result.parts)} parts:")
                 for part in result.parts:
-                    result_table.add_row(
-                        f"{part.part_number}/{part.total_parts}",
-                        format_time_human(part.duration),
-                        str(len(part.chapters)),
-                        part.output_path.name,
-                    )
-
-                console.print(result_table)
-                console.print()
-                console.print("[bold]Output files:[/bold]")
-                for path in result.output_files:
-                    console.print(f"  [green]✓[/green] {path}")
+                    print(f"  Part {part.part_number}: {part.output_path}")
             else:
-                console.print(
-                    Panel(
-                        f"[yellow]No split needed[/yellow] - file already under {max_hours:.1f} hours",
-                        border_style="yellow",
-                    )
-                )
-        else:
-            console.print(
-                Panel(
-                    f"[red bold]Error:[/red bold] {result.error_message}",
-                    title="Split Failed",
-                    border_style="red",
-                )
-            )
-            raise typer.Exit(1)
-
-    @app.callback(invoke_without_command=True)
-    def main_callback(
-        ctx: typer.Context,
-        version: bool = typer.Option(False, "--version", "-v", help="Show version"),
-    ) -> None:
-        """M4B Splitter - Split audiobook files by chapter."""
-        if version:
-            from m4b_splitter import __version__
-
-            console.print(f"m4b-splitter version {__version__}")
-            raise typer.Exit()
-
-        if ctx.invoked_subcommand is None:
-            console.print(ctx.get_help())
-
-
-# ============================================================================
-# Fallback CLI (when typer/rich not available)
-# ============================================================================
-
-else:
-    import argparse
-
-    def fallback_main() -> int:
-        """Fallback CLI using argparse."""
-        parser = argparse.ArgumentParser(
-            prog="m4b-splitter", description="Split M4B audiobook files by chapter."
-        )
-
-        subparsers = parser.add_subparsers(dest="command")
-        subparsers.add_parser("check", help="Check ffmpeg installation")
-        subparsers.add_parser("presets", help="Show iPod presets")
-
-        split_parser = subparsers.add_parser("split", help="Split an M4B file")
-        split_parser.add_argument("input_file", type=Path, help="Input M4B file")
-        split_parser.add_argument("-o", "--output", type=Path, help="Output directory")
-        split_parser.add_argument("-d", "--duration", default="8h")
-        split_parser.add_argument("-p", "--pattern", default="{title} - Part {part} of {total}.m4b")
-        split_parser.add_argument("--ipod", action="store_true")
-        split_parser.add_argument("--preset", default="standard", choices=list(IPOD_PRESETS.keys()))
-
-        parser.add_argument("-v", "--version", action="store_true")
-
-        args = parser.parse_args()
-
-        if args.version:
-            from m4b_splitter import __version__
-
-            print(f"m4b-splitter version {__version__}")
+                print("No split needed")
             return 0
+        else:
+            print(f"Error: {result.error_message}")
+            return 1
 
-        if args.command == "check":
-            result = check_dependencies()
-            print(format_dependency_check(result))
-            return 0 if result.all_found else 1
-
-        elif args.command == "presets":
-            print("\niPod Encoding Presets:")
-            for name, settings in IPOD_PRESETS.items():
-                print(f"  {name}: {settings}")
-            return 0
-
-        elif args.command == "split":
-            dep_result = check_dependencies()
-            if not dep_result.all_found:
-                print("Error: ffmpeg/ffprobe not found!")
-                return 1
-
-            try:
-                max_hours = parse_duration(args.duration)
-            except ValueError as e:
-                print(f"Error: {e}")
-                return 1
-
-            output_dir = args.output or args.input_file.parent
+    else:
+        parser.print_help()
+        return 0
 
-            print(f"\nSplitting: {args.input_file}")
-            print(f"Output:    {output_dir}")
-            print(f"Max:       {max_hours:.2f} hours")
-            if args.ipod:
-                print(f"iPod:      {args.preset}")
 
-            def progress_cb(step: str, percent: float, _: FFmpegProgress | None):
-                bar = "=" * int(percent / 2) + " " * (50 - int(percent / 2))
-                print(f"\r[{bar}] {percent:5.1f}% {step}", end="", flush=True)
+def _fallback_app() -> None:
+    """
+    Fallback CLI using argparse.
+    """
+    sys.exit(fallback_main())
 
-            splitter = M4BSplitter()
-            result = splitter.split(
-                input_file=args.input_file,
-                output_dir=output_dir,
-                max_duration_hours=max_hours,
-                output_pattern=args.pattern,
-                ipod_mode=args.ipod,
-                ipod_preset=args.preset,
-                progress_callback=progress_cb,
-            )
-
-            print("\n")
-
-            if result.success:
-                if result.parts:
-                    print(f"Success! Created {len(result.parts)} parts:")
-                    for part in result.parts:
-                        print(f"  Part {part.part_number}: {part.output_path}")
-                else:
-                    print("No split needed")
-                return 0
-            else:
-                print(f"Error: {result.error_message}")
-                return 1
 
+def __getattr__(name: str):
+    """Resolve ``app`` lazily so importing cli doesn't import typer/rich."""
+    if name == "app":
+        if RICH_AVAILABLE:
+            from m4b_splitter.rich_cli import app
         else:
-            parser.print_help()
-            return 0
-
-    def app() -> None:
-        """
-        Fallback CLI using argparse.
-        """
-        sys.exit(fallback_main())
+            app = _fallback_app
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:
     """Entry point for M4B Splitter CLI."""
+    # Fast path: a bare version query needs nothing beyond the package itself
+    if len(sys.argv) == 2 and sys.argv[1] in ("-v", "--version"):
+        from m4b_splitter import __version__
+
+        print(f"m4b-splitter version {__version__}")
+        return
+
     if RICH_AVAILABLE:
+        from m4b_splitter.rich_cli import app
+
         app()
     else:
         sys.exit(fallback_main())
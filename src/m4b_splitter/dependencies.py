@@ -1,13 +1,20 @@
 """FFmpeg dependency checking and installation guidance."""
 
+import functools
+import os
 import platform
+import re
 import shutil
 import subprocess
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import IntEnum, auto
+from pathlib import Path
+from types import MappingProxyType
 
 
-class OSType(Enum):
+class OSType(IntEnum):
     """Operating system types."""
 
     LINUX_DEBIAN = auto()  # Debian, Ubuntu, Mint, Pop!_OS
@@ -21,7 +28,7 @@ class OSType(Enum):
     UNKNOWN = auto()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DependencyStatus:
     """Status of a dependency check."""
 
@@ -31,7 +38,7 @@ class DependencyStatus:
     version: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DependencyCheckResult:
     """Result of checking all dependencies."""
 
@@ -56,118 +63,196 @@ class DependencyCheckResult:
         return missing
 
 
+def _detect_mac() -> tuple[OSType, str]:
+    version = platform.mac_ver()[0]
+    return OSType.MACOS, f"macOS {version}"
+
+
+def _detect_windows() -> tuple[OSType, str]:
+    version = platform.win32_ver()[0]
+    return OSType.WINDOWS, f"Windows {version}"
+
+
+# /etc/os-release is the modern standard; /usr/lib/os-release is the
+# documented fallback location per os-release(5).
+_OS_RELEASE_PATHS = ("/etc/os-release", "/usr/lib/os-release")
+
+# Matches KEY=value and KEY="value" lines; one C-level scan of the whole
+# file replaces the per-line split/strip loop.
+_OS_RELEASE_RE = re.compile(r'^([A-Z_]+)=(?:"([^"]*)"|(\S*))', re.MULTILINE)
+
+# Distribution ID → family; a single hash lookup replaces the sequential
+# tuple membership scans.
+_ID_TO_OSTYPE = {
+    "debian": OSType.LINUX_DEBIAN,
+    "ubuntu": OSType.LINUX_DEBIAN,
+    "linuxmint": OSType.LINUX_DEBIAN,
+    "pop": OSType.LINUX_DEBIAN,
+    "elementary": OSType.LINUX_DEBIAN,
+    "zorin": OSType.LINUX_DEBIAN,
+    "kali": OSType.LINUX_DEBIAN,
+    "fedora": OSType.LINUX_REDHAT,
+    "rhel": OSType.LINUX_REDHAT,
+    "centos": OSType.LINUX_REDHAT,
+    "rocky": OSType.LINUX_REDHAT,
+    "almalinux": OSType.LINUX_REDHAT,
+    "oracle": OSType.LINUX_REDHAT,
+    "arch": OSType.LINUX_ARCH,
+    "manjaro": OSType.LINUX_ARCH,
+    "endeavouros": OSType.LINUX_ARCH,
+    "garuda": OSType.LINUX_ARCH,
+    "opensuse": OSType.LINUX_SUSE,
+    "suse": OSType.LINUX_SUSE,
+    "opensuse-leap": OSType.LINUX_SUSE,
+    "opensuse-tumbleweed": OSType.LINUX_SUSE,
+    "alpine": OSType.LINUX_ALPINE,
+}
+
+# ID_LIKE tokens (space-separated per os-release(5)) that identify a family.
+_LIKE_TO_OSTYPE = {
+    "debian": OSType.LINUX_DEBIAN,
+    "ubuntu": OSType.LINUX_DEBIAN,
+    "fedora": OSType.LINUX_REDHAT,
+    "rhel": OSType.LINUX_REDHAT,
+    "arch": OSType.LINUX_ARCH,
+    "suse": OSType.LINUX_SUSE,
+    "opensuse": OSType.LINUX_SUSE,
+}
+
+
+def _detect_linux() -> tuple[OSType, str]:
+    """Detect the Linux distribution from os-release."""
+    for os_release_path in _OS_RELEASE_PATHS:
+        try:
+            with open(os_release_path) as f:
+                text = f.read()
+        except OSError:
+            continue
+
+        os_release = {
+            m.group(1): m.group(2) if m.group(2) is not None else m.group(3)
+            for m in _OS_RELEASE_RE.finditer(text)
+        }
+
+        dist_id = os_release.get("ID", "").lower()
+        dist_id_like = os_release.get("ID_LIKE", "").lower()
+        dist_name = os_release.get("PRETTY_NAME", "Linux")
+
+        os_type = _ID_TO_OSTYPE.get(dist_id)
+        if os_type is not None:
+            return os_type, dist_name
+
+        # Fall back to the ID_LIKE ancestry (e.g. ID=neon, ID_LIKE="ubuntu debian")
+        for token in dist_id_like.split():
+            os_type = _LIKE_TO_OSTYPE.get(token)
+            if os_type is not None:
+                return os_type, dist_name
+
+        return OSType.LINUX_OTHER, dist_name
+
+    return OSType.LINUX_OTHER, "Linux"
+
+
+# Dispatch table: one dict lookup replaces the if/elif platform chain, and
+# guarantees the os-release code can never run on macOS/Windows.
+_OS_DETECTORS = {
+    "darwin": _detect_mac,
+    "windows": _detect_windows,
+    "linux": _detect_linux,
+}
+
+
+@functools.lru_cache(maxsize=1)
 def detect_os() -> tuple[OSType, str]:
     """
     Detect the operating system and distribution.
 
+    The result is cached: the OS does not change under a running process
+    and the Linux branch reads /etc/os-release on every call.
+
     Returns:
         Tuple of (OSType, human-readable name).
     """
-    system = platform.system().lower()
-
-    if system == "darwin":
-        version = platform.mac_ver()[0]
-        return OSType.MACOS, f"macOS {version}"
-
-    elif system == "windows":
-        version = platform.win32_ver()[0]
-        return OSType.WINDOWS, f"Windows {version}"
+    detector = _OS_DETECTORS.get(platform.system().lower())
+    if detector is not None:
+        return detector()
+    return OSType.UNKNOWN, platform.system()
 
-    elif system == "linux":
-        # Try to detect Linux distribution
-        try:
-            # Try /etc/os-release first (modern standard)
-            with open("/etc/os-release") as f:
-                os_release = {}
-                for line in f:
-                    if "=" in line:
-                        key, value = line.strip().split("=", 1)
-                        os_release[key] = value.strip('"')
-
-                dist_id = os_release.get("ID", "").lower()
-                dist_id_like = os_release.get("ID_LIKE", "").lower()
-                dist_name = os_release.get("PRETTY_NAME", "Linux")
-
-                # Check for Debian-based
-                if dist_id in (
-                    "debian",
-                    "ubuntu",
-                    "linuxmint",
-                    "pop",
-                    "elementary",
-                    "zorin",
-                    "kali",
-                ):
-                    return OSType.LINUX_DEBIAN, dist_name
-                if "debian" in dist_id_like or "ubuntu" in dist_id_like:
-                    return OSType.LINUX_DEBIAN, dist_name
-
-                # Check for Red Hat-based
-                if dist_id in ("fedora", "rhel", "centos", "rocky", "almalinux", "oracle"):
-                    return OSType.LINUX_REDHAT, dist_name
-                if "fedora" in dist_id_like or "rhel" in dist_id_like:
-                    return OSType.LINUX_REDHAT, dist_name
-
-                # Check for Arch-based
-                if dist_id in ("arch", "manjaro", "endeavouros", "garuda"):
-                    return OSType.LINUX_ARCH, dist_name
-                if "arch" in dist_id_like:
-                    return OSType.LINUX_ARCH, dist_name
-
-                # Check for SUSE-based
-                if dist_id in ("opensuse", "suse", "opensuse-leap", "opensuse-tumbleweed"):
-                    return OSType.LINUX_SUSE, dist_name
-                if "suse" in dist_id_like:
-                    return OSType.LINUX_SUSE, dist_name
-
-                # Check for Alpine
-                if dist_id == "alpine":
-                    return OSType.LINUX_ALPINE, dist_name
-
-                return OSType.LINUX_OTHER, dist_name
-
-        except FileNotFoundError:
-            pass
-
-        return OSType.LINUX_OTHER, "Linux"
 
-    return OSType.UNKNOWN, platform.system()
+# Version strings keyed by (path, mtime): upgrading the binary changes
+# its mtime and invalidates the entry naturally.
+_version_cache: dict[tuple[str, int], str | None] = {}
 
 
 def get_version(executable: str) -> str | None:
     """
     Get version string of an executable.
 
+    Results are cached per (path, mtime), so repeated checks skip the
+    subprocess until the binary itself changes.
+
     Args:
         executable: Path to the executable.
 
     Returns:
         Version string or None if not found.
     """
+    # Paths that can't be stat-ed (missing, or bare names) skip the cache
     try:
+        key = (executable, Path(executable).stat().st_mtime_ns)
+    except OSError:
+        key = None
+    if key is not None and key in _version_cache:
+        return _version_cache[key]
+
+    version: str | None = None
+    try:
+        # -hide_banner trims the build-config dump; printing a version is
+        # local and instant, so a short timeout only guards pathological cases.
         result = subprocess.run(
-            [executable, "-version"], check=False, capture_output=True, text=True, timeout=10
+            [executable, "-hide_banner", "-version"],
+            check=False,
+            capture_output=True,
+            text=True,
+            timeout=3,
         )
         if result.returncode == 0:
             # Extract first line which usually contains version
-            first_line = result.stdout.split("\n")[0]
-            return first_line
+            version = result.stdout.split("\n", 1)[0]
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
         pass
-    return None
+
+    if key is not None:
+        _version_cache[key] = version
+    return version
+
+
+@functools.lru_cache(maxsize=8)
+def _which(name: str, path_env: str) -> str | None:
+    """shutil.which memoized per (name, PATH).
+
+    which() stats every PATH entry; keying the cache on the PATH string
+    itself means a changed environment misses naturally instead of
+    returning a stale hit.
+    """
+    return shutil.which(name, path=path_env or None)
 
 
+@functools.cache
 def check_dependency(name: str) -> DependencyStatus:
     """
     Check if a dependency is available.
 
+    Cached per name: the PATH lookup plus version subprocess is expensive
+    (notably on Windows) and PATH rarely changes under a running process.
+
     Args:
         name: Name of the executable to check.
 
     Returns:
         DependencyStatus with check results.
     """
-    path = shutil.which(name)
+    path = _which(name, os.environ.get("PATH", ""))
 
     if path:
         version = get_version(path)
@@ -176,35 +261,51 @@ def check_dependency(name: str) -> DependencyStatus:
     return DependencyStatus(name=name, found=False)
 
 
+@functools.lru_cache(maxsize=1)
 def check_dependencies() -> DependencyCheckResult:
     """
     Check all required dependencies.
 
+    The result is cached for the lifetime of the process since PATH rarely
+    changes underneath a running CLI and each check spawns subprocesses.
+    Call :func:`invalidate_dependency_cache` to force a re-check.
+
     Returns:
         DependencyCheckResult with status of all dependencies.
     """
-    os_type, os_name = detect_os()
+    # The two probes each block on a version subprocess; run them in
+    # parallel (subprocess.run releases the GIL while waiting) and detect
+    # the OS on this thread in the meantime.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        ffmpeg_future = pool.submit(check_dependency, "ffmpeg")
+        ffprobe_future = pool.submit(check_dependency, "ffprobe")
+        os_type, os_name = detect_os()
+
+        return DependencyCheckResult(
+            ffmpeg=ffmpeg_future.result(),
+            ffprobe=ffprobe_future.result(),
+            os_type=os_type,
+            os_name=os_name,
+        )
 
-    return DependencyCheckResult(
-        ffmpeg=check_dependency("ffmpeg"),
-        ffprobe=check_dependency("ffprobe"),
-        os_type=os_type,
-        os_name=os_name,
-    )
 
+def invalidate_dependency_cache() -> None:
+    """
+    Clear all cached dependency lookups.
 
-def get_installation_instructions(os_type: OSType) -> str:
+    Useful after installing ffmpeg mid-session or changing PATH.
     """
-    Get installation instructions for the detected OS.
+    detect_os.cache_clear()
+    _version_cache.clear()
+    _which.cache_clear()
+    check_dependency.cache_clear()
+    check_dependencies.cache_clear()
 
-    Args:
-        os_type: The detected operating system type.
 
-    Returns:
-        Installation instructions as a string.
-    """
-    instructions = {
-        OSType.LINUX_DEBIAN: """
+# Installation guidance per OS family, built once at import; the proxy
+# wrapper keeps the table read-only.
+_INSTRUCTIONS: Mapping[OSType, str] = MappingProxyType({
+    OSType.LINUX_DEBIAN: """
   For Debian/Ubuntu/Mint, run:
     sudo apt update
     sudo apt install ffmpeg
@@ -213,7 +314,7 @@ def get_installation_instructions(os_type: OSType) -> str:
     sudo add-apt-repository ppa:savoury1/ffmpeg4
     sudo apt update
     sudo apt install ffmpeg""",
-        OSType.LINUX_REDHAT: """
+    OSType.LINUX_REDHAT: """
   For Fedora, run:
     sudo dnf install ffmpeg ffmpeg-devel
 
@@ -221,10 +322,10 @@ def get_installation_instructions(os_type: OSType) -> str:
     sudo dnf install epel-release
     sudo dnf install --nogpgcheck https://mirrors.rpmfusion.org/free/el/rpmfusion-free-release-$(rpm -E %rhel).noarch.rpm
     sudo dnf install ffmpeg""",
-        OSType.LINUX_ARCH: """
+    OSType.LINUX_ARCH: """
   For Arch/Manjaro, run:
     sudo pacman -S ffmpeg""",
-        OSType.LINUX_SUSE: """
+    OSType.LINUX_SUSE: """
   For openSUSE, run:
     sudo zypper install ffmpeg
 
@@ -232,10 +333,10 @@ def get_installation_instructions(os_type: OSType) -> str:
     sudo zypper addrepo -cfp 90 'https://ftp.gwdg.de/pub/linux/misc/packman/suse/openSUSE_Tumbleweed/' packman
     sudo zypper refresh
     sudo zypper install --from packman ffmpeg""",
-        OSType.LINUX_ALPINE: """
+    OSType.LINUX_ALPINE: """
   For Alpine Linux, run:
     sudo apk add ffmpeg""",
-        OSType.LINUX_OTHER: """
+    OSType.LINUX_OTHER: """
   For most Linux distributions, ffmpeg is available in the package manager.
   Try one of these commands:
     sudo apt install ffmpeg      # Debian-based
@@ -245,7 +346,7 @@ def get_installation_instructions(os_type: OSType) -> str:
 
   Or build from source:
     https://ffmpeg.org/download.html#build-linux""",
-        OSType.MACOS: """
+    OSType.MACOS: """
   For macOS, the easiest way is using Homebrew:
     brew install ffmpeg
 
@@ -255,7 +356,7 @@ def get_installation_instructions(os_type: OSType) -> str:
 
   Alternatively, use MacPorts:
     sudo port install ffmpeg""",
-        OSType.WINDOWS: """
+    OSType.WINDOWS: """
   For Windows, you have several options:
 
   Option 1 - Using Chocolatey (recommended):
@@ -274,14 +375,60 @@ def get_installation_instructions(os_type: OSType) -> str:
     3. Add the 'bin' folder to your PATH environment variable
 
   After installation, restart your terminal/command prompt.""",
-        OSType.UNKNOWN: """
+    OSType.UNKNOWN: """
   Please visit https://ffmpeg.org/download.html for installation
   instructions for your operating system.
 
   FFmpeg is available for Windows, macOS, Linux, and BSD systems.""",
-    }
+})
+
+
+def get_installation_instructions(os_type: OSType) -> str:
+    """
+    Get installation instructions for the detected OS.
+
+    Args:
+        os_type: The detected operating system type.
+
+    Returns:
+        Installation instructions as a string.
+    """
+    return _INSTRUCTIONS.get(os_type, _INSTRUCTIONS[OSType.UNKNOWN])
+
 
-    return instructions.get(os_type, instructions[OSType.UNKNOWN])
+# Interned rule strings and the report skeleton, built once at import.
+_RULE = "=" * 60
+_THIN_RULE = "-" * 40
+
+_REPORT_TEMPLATE = f"""{_RULE}
+DEPENDENCY CHECK
+{_RULE}
+
+Operating System: {{os_name}}
+
+{{ffmpeg_block}}
+
+{{ffprobe_block}}
+
+{{status_block}}
+
+{_RULE}"""
+
+
+def _format_tool_status(status: DependencyStatus) -> str:
+    """Format the found/not-found block for one tool."""
+    label = f"{status.name + ':':<9}"
+    if not status.found:
+        return f"✗ {label}NOT FOUND"
+
+    block = f"✓ {label}Found\n  Path:    {status.path}"
+    if status.version:
+        # Truncate long version strings
+        version = status.version
+        if len(version) > 60:
+            version = version[:57] + "..."
+        block += f"\n  Version: {version}"
+    return block
 
 
 def format_dependency_check(result: DependencyCheckResult) -> str:
@@ -294,56 +441,21 @@ def format_dependency_check(result: DependencyCheckResult) -> str:
     Returns:
         Formatted string for display.
     """
-    lines = []
-    lines.append("=" * 60)
-    lines.append("DEPENDENCY CHECK")
-    lines.append("=" * 60)
-    lines.append(f"\nOperating System: {result.os_name}")
-    lines.append("")
-
-    # FFmpeg status
-    if result.ffmpeg.found:
-        lines.append("✓ ffmpeg:  Found")
-        lines.append(f"  Path:    {result.ffmpeg.path}")
-        if result.ffmpeg.version:
-            # Truncate long version strings
-            version = result.ffmpeg.version
-            if len(version) > 60:
-                version = version[:57] + "..."
-            lines.append(f"  Version: {version}")
-    else:
-        lines.append("✗ ffmpeg:  NOT FOUND")
-
-    lines.append("")
-
-    # FFprobe status
-    if result.ffprobe.found:
-        lines.append("✓ ffprobe: Found")
-        lines.append(f"  Path:    {result.ffprobe.path}")
-        if result.ffprobe.version:
-            version = result.ffprobe.version
-            if len(version) > 60:
-                version = version[:57] + "..."
-            lines.append(f"  Version: {version}")
-    else:
-        lines.append("✗ ffprobe: NOT FOUND")
-
-    lines.append("")
-
-    # Overall status and instructions
     if result.all_found:
-        lines.append("Status: All dependencies satisfied ✓")
+        status_block = "Status: All dependencies satisfied ✓"
     else:
-        lines.append(f"Status: Missing dependencies: {', '.join(result.missing)}")
-        lines.append("")
-        lines.append("INSTALLATION INSTRUCTIONS")
-        lines.append("-" * 40)
-        lines.append(get_installation_instructions(result.os_type))
-
-    lines.append("")
-    lines.append("=" * 60)
+        status_block = (
+            f"Status: Missing dependencies: {', '.join(result.missing)}\n\n"
+            f"INSTALLATION INSTRUCTIONS\n{_THIN_RULE}\n"
+            f"{get_installation_instructions(result.os_type)}"
+        )
 
-    return "\n".join(lines)
+    return _REPORT_TEMPLATE.format(
+        os_name=result.os_name,
+        ffmpeg_block=_format_tool_status(result.ffmpeg),
+        ffprobe_block=_format_tool_status(result.ffprobe),
+        status_block=status_block,
+    )
 
 
 def ensure_dependencies() -> DependencyCheckResult:
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Chapter:
     """Represents a chapter in an M4B audiobook."""
 
@@ -22,7 +22,7 @@ class Chapter:
         return f"Chapter {self.id}: {self.title} ({self.duration:.1f}s)"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AudioMetadata:
     """Metadata for an M4B audiobook file."""
 
@@ -65,7 +65,7 @@ class AudioMetadata:
         return metadata
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SplitPart:
     """Represents a part of a split audiobook."""
 
@@ -98,7 +98,7 @@ class SplitPart:
         return f"Part {self.part_number}/{self.total_parts}: {len(self.chapters)} chapters, {self.duration:.1f}s"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SplitResult:
     """Result of an M4B split operation."""
 
@@ -1,6 +1,8 @@
 """Module for probing M4B files to extract metadata and chapters."""
 
+import functools
 import json
+import os
 import subprocess
 from pathlib import Path
 
@@ -17,6 +19,10 @@ def probe_file(file_path: Path) -> dict:
     """
     Probe an M4B file using ffprobe and return raw JSON data.
 
+    Results are cached per (path, mtime, size), so validating, extracting
+    metadata and extracting chapters from the same file spawn only one
+    ffprobe between them.
+
     Args:
         file_path: Path to the M4B file.
 
@@ -26,9 +32,22 @@ def probe_file(file_path: Path) -> dict:
     Raises:
         ProbeError: If ffprobe fails or file doesn't exist.
     """
-    if not file_path.exists():
-        raise ProbeError(f"File not found: {file_path}")
+    # A single stat() serves both the existence check and the cache key
+    try:
+        st = file_path.stat()
+    except OSError as e:
+        raise ProbeError(f"File not found: {file_path}") from e
+
+    return _probe_cached(os.fspath(file_path), st.st_mtime_ns, st.st_size)
+
 
+@functools.lru_cache(maxsize=32)
+def _probe_cached(path_str: str, mtime_ns: int, size: int) -> dict:  # noqa: ARG001
+    """Run ffprobe; mtime and size key the cache and invalidate on edit.
+
+    mtime_ns and size are deliberately unused in the body: they exist
+    only as lru_cache key components (hence the noqa).
+    """
     cmd = [
         "ffprobe",
         "-v",
@@ -38,16 +57,42 @@ def probe_file(file_path: Path) -> dict:
         "-show_format",
         "-show_streams",
         "-show_chapters",
-        str(file_path),
+        path_str,
     ]
 
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        return json.loads(result.stdout)
-    except subprocess.CalledProcessError as e:
-        raise ProbeError(f"ffprobe failed: {e.stderr}") from e
-    except json.JSONDecodeError as e:
-        raise ProbeError(f"Failed to parse ffprobe output: {e}") from e
+    # Feed ffprobe's stdout to the JSON parser as raw bytes: json handles
+    # the decoding itself, so the output (which can be large for books with
+    # many chapters) is never copied into an intermediate text buffer.
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+        try:
+            data = json.load(proc.stdout)
+        except json.JSONDecodeError as e:
+            stderr = proc.stderr.read().decode("utf-8", "replace")
+            if proc.wait() != 0:
+                raise ProbeError(f"ffprobe failed: {stderr}") from e
+            raise ProbeError(f"Failed to parse ffprobe output: {e}") from e
+        stderr = proc.stderr.read().decode("utf-8", "replace")
+        if proc.wait() != 0:
+            raise ProbeError(f"ffprobe failed: {stderr}")
+
+    return data
+
+
+def _parse_chapters(data: dict) -> list[Chapter]:
+    """Build Chapter objects from raw ffprobe data."""
+    chapters = []
+    for i, ch in enumerate(data.get("chapters", [])):
+        # Get chapter times - ffprobe provides these as strings
+        start_time = float(ch.get("start_time", 0))
+        end_time = float(ch.get("end_time", 0))
+
+        # Get title from tags or use default
+        tags = ch.get("tags", {})
+        title = tags.get("title", f"Chapter {i + 1}")
+
+        chapters.append(Chapter(id=i, title=title, start_time=start_time, end_time=end_time))
+
+    return chapters
 
 
 def extract_chapters(file_path: Path) -> list[Chapter]:
@@ -63,24 +108,9 @@ def extract_chapters(file_path: Path) -> list[Chapter]:
     Raises:
         ProbeError: If probing fails or no chapters found.
     """
-    data = probe_file(file_path)
-
-    chapters_data = data.get("chapters", [])
-    if not chapters_data:
+    chapters = _parse_chapters(probe_file(file_path))
+    if not chapters:
         raise ProbeError(f"No chapters found in: {file_path}")
-
-    chapters = []
-    for i, ch in enumerate(chapters_data):
-        # Get chapter times - ffprobe provides these as strings
-        start_time = float(ch.get("start_time", 0))
-        end_time = float(ch.get("end_time", 0))
-
-        # Get title from tags or use default
-        tags = ch.get("tags", {})
-        title = tags.get("title", f"Chapter {i + 1}")
-
-        chapters.append(Chapter(id=i, title=title, start_time=start_time, end_time=end_time))
-
     return chapters
 
 
@@ -97,33 +127,13 @@ def extract_metadata(file_path: Path) -> AudioMetadata:
     Raises:
         ProbeError: If probing fails.
     """
-    data = probe_file(file_path)
+    return _parse_metadata(probe_file(file_path))
 
-    format_data = data.get("format", {})
-    format_tags = format_data.get("tags", {})
 
-    # Find audio stream
-    streams = data.get("streams", [])
-    audio_stream = None
-    for stream in streams:
-        if stream.get("codec_type") == "audio":
-            audio_stream = stream
-            break
-
-    # Extract known tags (case-insensitive lookup)
-    def get_tag(key: str) -> str | None:
-        # Try exact match first
-        if key in format_tags:
-            return format_tags[key]
-        # Try case-insensitive
-        key_lower = key.lower()
-        for k, v in format_tags.items():
-            if k.lower() == key_lower:
-                return v
-        return None
-
-    # Known tag keys to extract
-    known_keys = {
+# Tag keys that map to named AudioMetadata fields; everything else lands
+# in extra_tags.
+_KNOWN_TAG_KEYS = frozenset(
+    {
         "title",
         "artist",
         "album",
@@ -134,14 +144,45 @@ def extract_metadata(file_path: Path) -> AudioMetadata:
         "comment",
         "encoder",
     }
+)
+
 
-    # Build extra tags dict with remaining tags
-    extra_tags = {}
+def _parse_metadata(data: dict) -> AudioMetadata:
+    """Build AudioMetadata from raw ffprobe data."""
+    format_data = data.get("format", {})
+    format_tags = format_data.get("tags", {})
+
+    # Find first audio stream, if any
+    audio_stream = next(
+        (s for s in data.get("streams", []) if s.get("codec_type") == "audio"), None
+    )
+
+    # Split known tags from extras in one pass, casefolding each key once
+    # (instead of re-scanning the whole tag dict per known key).
+    known: dict[str, str] = {}
+    extra_tags: dict[str, str] = {}
     for k, v in format_tags.items():
-        if k.lower() not in known_keys:
+        folded = k.casefold()
+        if folded in _KNOWN_TAG_KEYS:
+            # An exact lowercase key wins over differently-cased duplicates
+            if k == folded or folded not in known:
+                known[folded] = v
+        else:
             extra_tags[k] = v
 
-    metadata = AudioMetadata(
+    get_tag = known.get
+
+    # Stream-specific info if available (AudioMetadata is frozen, so all
+    # fields go through the constructor)
+    sample_rate = 0
+    channels = 0
+    codec = None
+    if audio_stream:
+        sample_rate = int(audio_stream.get("sample_rate", 0))
+        channels = int(audio_stream.get("channels", 0))
+        codec = audio_stream.get("codec_name")
+
+    return AudioMetadata(
         title=get_tag("title"),
         artist=get_tag("artist"),
         album=get_tag("album"),
@@ -153,17 +194,12 @@ def extract_metadata(file_path: Path) -> AudioMetadata:
         encoder=get_tag("encoder"),
         duration=float(format_data.get("duration", 0)),
         bit_rate=int(format_data.get("bit_rate", 0)),
+        sample_rate=sample_rate,
+        channels=channels,
+        codec=codec,
         extra_tags=extra_tags,
     )
 
-    # Add stream-specific info if available
-    if audio_stream:
-        metadata.sample_rate = int(audio_stream.get("sample_rate", 0))
-        metadata.channels = int(audio_stream.get("channels", 0))
-        metadata.codec = audio_stream.get("codec_name")
-
-    return metadata
-
 
 def get_duration(file_path: Path) -> float:
     """
@@ -196,24 +232,56 @@ def validate_m4b_file(file_path: Path) -> tuple[bool, str]:
     if not file_path.exists():
         return False, f"File not found: {file_path}"
 
-    if file_path.suffix.lower() not in (".m4b", ".m4a", ".mp4"):
+    if file_path.suffix.lower() not in _VALID_SUFFIXES:
         return False, f"Invalid file extension: {file_path.suffix}"
 
     try:
         data = probe_file(file_path)
+    except ProbeError as e:
+        return False, str(e)
 
-        # Check for audio stream
-        streams = data.get("streams", [])
-        has_audio = any(s.get("codec_type") == "audio" for s in streams)
-        if not has_audio:
-            return False, "No audio stream found"
+    return _validate_streams(data)
 
-        # Check for chapters
-        chapters = data.get("chapters", [])
-        if not chapters:
-            return False, "No chapters found (required for splitting)"
 
-        return True, f"Valid M4B file with {len(chapters)} chapters"
+_VALID_SUFFIXES = (".m4b", ".m4a", ".mp4")
 
-    except ProbeError as e:
-        return False, str(e)
+
+def _validate_streams(data: dict) -> tuple[bool, str]:
+    """Check raw ffprobe data for an audio stream and chapters."""
+    streams = data.get("streams", [])
+    has_audio = any(s.get("codec_type") == "audio" for s in streams)
+    if not has_audio:
+        return False, "No audio stream found"
+
+    chapters = data.get("chapters", [])
+    if not chapters:
+        return False, "No chapters found (required for splitting)"
+
+    return True, f"Valid M4B file with {len(chapters)} chapters"
+
+
+def probe_all(file_path: Path) -> tuple[list[Chapter], AudioMetadata, tuple[bool, str]]:
+    """
+    Extract chapters, metadata and validity from a single probe.
+
+    Equivalent to calling extract_chapters, extract_metadata and
+    validate_m4b_file, but guaranteed to spawn at most one ffprobe and
+    walk the probe JSON once per section.
+
+    Args:
+        file_path: Path to the M4B file.
+
+    Returns:
+        Tuple of (chapters, metadata, (is_valid, message)).
+
+    Raises:
+        ProbeError: If ffprobe fails or the file doesn't exist.
+    """
+    # Check the extension before probing: a wrong file type needs no
+    # ffprobe spawn, and the verdict reads better than raw ffprobe stderr
+    if file_path.suffix.lower() not in _VALID_SUFFIXES:
+        validity = (False, f"Invalid file extension: {file_path.suffix}")
+        return [], AudioMetadata(), validity
+
+    data = probe_file(file_path)
+    return _parse_chapters(data), _parse_metadata(data), _validate_streams(data)
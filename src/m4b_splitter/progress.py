@@ -1,13 +1,16 @@
 """Progress tracking and display for M4B splitting operations."""
 
 import sys
-from abc import ABC, abstractmethod
+import time
 from dataclasses import dataclass
-from enum import Enum, auto
-from typing import ClassVar, TextIO
+from enum import IntEnum, auto
+from typing import TYPE_CHECKING, ClassVar, Protocol, TextIO, runtime_checkable
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-class ProgressStep(Enum):
+
+class ProgressStep(IntEnum):
     """Steps in the M4B splitting process."""
 
     VALIDATING = auto()
@@ -20,7 +23,7 @@ class ProgressStep(Enum):
     FINALIZING = auto()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProgressUpdate:
     """Represents a progress update."""
 
@@ -38,26 +41,28 @@ class ProgressUpdate:
         return (self.current / self.total) * 100
 
 
-class ProgressCallback(ABC):
-    """Abstract base class for progress callbacks."""
+@runtime_checkable
+class ProgressCallback(Protocol):
+    """Structural interface for progress callbacks.
+
+    Any object with these three methods works; no subclassing required
+    (a Protocol avoids ABC dispatch overhead on the hot update path).
+    """
 
-    @abstractmethod
     def on_progress(self, update: ProgressUpdate) -> None:
         """Called when progress is updated."""
-        pass
+        ...
 
-    @abstractmethod
     def on_complete(self, success: bool, message: str) -> None:
         """Called when operation completes."""
-        pass
+        ...
 
-    @abstractmethod
     def on_error(self, error: str) -> None:
         """Called when an error occurs."""
-        pass
+        ...
 
 
-class ConsoleProgress(ProgressCallback):
+class ConsoleProgress:
     """Console-based progress display."""
 
     STEP_NAMES: ClassVar[dict[ProgressStep, str]] = {
@@ -89,14 +94,18 @@ class ConsoleProgress(ProgressCallback):
         self.show_progress_bar = show_progress_bar
         self.bar_width = bar_width
         self._current_step: ProgressStep | None = None
+        # Prebuilt bar halves: each render slices these instead of
+        # re-expanding '█' * n twice per update.
+        self._full_bar = "█" * bar_width
+        self._empty_bar = "░" * bar_width
 
     def on_progress(self, update: ProgressUpdate) -> None:
         """Display progress update."""
-        step_name = self.STEP_NAMES.get(update.step, str(update.step))
-
-        # Print step header if step changed
+        # Print step header if step changed (the name lookup is only
+        # needed then, not on every bar update)
         if update.step != self._current_step:
             self._current_step = update.step
+            step_name = self.STEP_NAMES.get(update.step, str(update.step))
             print(f"\n[{step_name}]", file=self.output)
 
         # Build progress line
@@ -130,26 +139,40 @@ class ConsoleProgress(ProgressCallback):
         if total == 0:
             return "[" + " " * self.bar_width + "]"
 
-        filled = int((current / total) * self.bar_width)
-        empty = self.bar_width - filled
-        percentage = (current / total) * 100
+        # Integer math: one multiply + floor-divide each for fill and
+        # percentage instead of two float divisions per render.
+        filled = current * self.bar_width // total
+        pct_tenths = current * 1000 // total
 
-        return f"[{'█' * filled}{'░' * empty}] {percentage:5.1f}%"
+        return f"[{self._full_bar[:filled]}{self._empty_bar[filled:]}] {pct_tenths / 10:5.1f}%"
 
 
-class SilentProgress(ProgressCallback):
-    """Silent progress callback that doesn't output anything."""
+class SilentProgress:
+    """Silent progress callback that doesn't output anything.
 
-    def on_progress(self, update: ProgressUpdate) -> None:
+    Stateless; use the shared :data:`SILENT_PROGRESS` instance instead of
+    constructing new ones. The no-ops are staticmethods so dispatch skips
+    the self bind.
+    """
+
+    @staticmethod
+    def on_progress(update: ProgressUpdate) -> None:
         pass
 
-    def on_complete(self, success: bool, message: str) -> None:
+    @staticmethod
+    def on_complete(success: bool, message: str) -> None:
         pass
 
-    def on_error(self, error: str) -> None:
+    @staticmethod
+    def on_error(error: str) -> None:
         pass
 
 
+#: Shared no-op callback; SilentProgress carries no state, so one
+#: instance serves every operation.
+SILENT_PROGRESS = SilentProgress()
+
+
 class ProgressTracker:
     """
     Tracks progress and notifies callbacks.
@@ -158,17 +181,29 @@ class ProgressTracker:
     allowing multiple callbacks to be notified of progress updates.
     """
 
+    #: Minimum interval between emitted bar updates (50ms ≈ 20 fps; far
+    #: faster than a terminal usefully renders).
+    EMIT_INTERVAL_NS: ClassVar[int] = 50_000_000
+
     def __init__(self) -> None:
         """Initialize progress tracker."""
         self._callbacks: list[ProgressCallback] = []
+        # Bound on_progress methods, resolved once at registration so the
+        # hot update() loop skips an attribute lookup per callback per event.
+        self._on_progress_fns: list[Callable[[ProgressUpdate], None]] = []
+        self._last_emit_ns = 0
+        self._last_step: ProgressStep | None = None
+        self._pending_update: ProgressUpdate | None = None
 
     def add_callback(self, callback: ProgressCallback) -> None:
         """Add a progress callback."""
         self._callbacks.append(callback)
+        self._on_progress_fns.append(callback.on_progress)
 
     def remove_callback(self, callback: ProgressCallback) -> None:
         """Remove a progress callback."""
         self._callbacks.remove(callback)
+        self._on_progress_fns = [cb.on_progress for cb in self._callbacks]
 
     def update(
         self,
@@ -187,12 +222,40 @@ class ProgressTracker:
             current: Current progress count.
             total: Total items to process.
             detail: Optional detail message.
+
+        Intermediate bar positions arriving within EMIT_INTERVAL_NS of the
+        last emitted update are coalesced: the newest one is stashed and
+        flushed on the next emit, on a step change, or in complete(), so
+        the latest state is never lost. Step changes and the final
+        current == total update always get through immediately.
         """
         update = ProgressUpdate(
             step=step, message=message, current=current, total=total, detail=detail
         )
-        for callback in self._callbacks:
-            callback.on_progress(update)
+
+        now = time.monotonic_ns()
+        if (
+            step is self._last_step
+            and current < total
+            and now - self._last_emit_ns < self.EMIT_INTERVAL_NS
+        ):
+            self._pending_update = update
+            return
+
+        self._flush_pending()
+        self._last_step = step
+        self._last_emit_ns = now
+
+        for fn in self._on_progress_fns:
+            fn(update)
+
+    def _flush_pending(self) -> None:
+        """Emit the stashed throttled update, if any."""
+        pending = self._pending_update
+        if pending is not None:
+            self._pending_update = None
+            for fn in self._on_progress_fns:
+                fn(pending)
 
     def complete(self, success: bool, message: str) -> None:
         """
@@ -202,6 +265,7 @@ class ProgressTracker:
             success: Whether the operation was successful.
             message: Completion message.
         """
+        self._flush_pending()
         for callback in self._callbacks:
             callback.on_complete(success, message)
 
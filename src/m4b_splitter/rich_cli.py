@@ -0,0 +1,318 @@
+# ruff: noqa: B008
+"""Rich/Typer command-line interface for M4B splitter.
+
+This module imports typer and rich at load time; it is only imported by
+:mod:`m4b_splitter.cli` once their availability has been confirmed, so the
+fallback CLI never pays for these imports.
+"""
+
+import queue
+import threading
+from enum import Enum
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+from rich.progress import (
+    BarColumn,
+    Progress,
+    SpinnerColumn,
+    TaskProgressColumn,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn,
+)
+from rich.table import Table
+from rich.text import Text
+
+from m4b_splitter import (
+    IPOD_PRESETS,
+    FFmpegProgress,
+    M4BSplitter,
+    format_time_human,
+)
+from m4b_splitter.cli import _offer_latest, parse_duration
+from m4b_splitter.dependencies import check_dependencies, format_dependency_check
+from m4b_splitter.splitter import get_available_hwaccels
+
+# Derived from IPOD_PRESETS so the accepted choices can never drift from the
+# presets the splitter actually knows about.
+PresetChoice = Enum("PresetChoice", {name: name for name in IPOD_PRESETS}, type=str)
+
+
+app = typer.Typer(
+    name="m4b-splitter",
+    help="Split M4B audiobook files by chapter at specified duration limits.",
+    add_completion=False,
+    rich_markup_mode="rich",
+)
+
+console = Console()
+
+# Static display data for the presets table; rendered once and cached.
+_PRESET_INFO = (
+    ("standard", "22050 Hz", "64 kbps", "Mono", "VBR", "~55h", "Most audiobooks"),
+    ("high", "44100 Hz", "128 kbps", "Stereo", "VBR", "~27h", "Music/High quality"),
+    ("extended", "16000 Hz", "48 kbps", "Mono", "VBR", "~74h", "Very long books"),
+    ("video", "44100 Hz", "80 kbps", "Mono", "CBR", "~27h", "iPod Video (5th Gen)"),
+)
+
+_presets_rendered: str | None = None
+
+
+def print_presets_table() -> None:
+    global _presets_rendered
+
+    if _presets_rendered is None:
+        table = Table(
+            title="iPod Encoding Presets", show_header=True, header_style="bold cyan"
+        )
+        table.add_column("Preset", style="green")
+        table.add_column("Sample Rate")
+        table.add_column("Bitrate")
+        table.add_column("Channels")
+        table.add_column("Mode")
+        table.add_column("Max Duration", style="yellow")
+        table.add_column("Best For")
+
+        for row in _PRESET_INFO:
+            table.add_row(*row)
+
+        with console.capture() as capture:
+            console.print(table)
+        _presets_rendered = capture.get()
+
+    console.file.write(_presets_rendered)
+
+
+@app.command()
+def check() -> None:
+    """Check if ffmpeg/ffprobe are installed."""
+    result = check_dependencies()
+
+    if result.all_found:
+        content = Text.from_markup(
+            "[green bold]✓ [/green bold][green]All dependencies found!\n\n[/green]"
+            f"[dim]OS: {result.os_name}\n\n[/dim]"
+            f"[cyan]ffmpeg:  {result.ffmpeg.path}\n"
+            f"ffprobe: {result.ffprobe.path}\n[/cyan]"
+        )
+        console.print(Panel(content, title="Dependency Check", border_style="green"))
+    else:
+        console.print(format_dependency_check(result))
+        raise typer.Exit(1)
+
+
+@app.command()
+def presets() -> None:
+    """Show available iPod encoding presets."""
+    print_presets_table()
+
+
+@app.command()
+def split(
+    input_file: Path = typer.Argument(..., help="Input M4B file to split", exists=True),
+    output_dir: Path = typer.Option(None, "--output", "-o", help="Output directory"),
+    max_duration: str = typer.Option("8h", "--duration", "-d", help="Max duration per part"),
+    pattern: str = typer.Option("{title} - Part {part} of {total}.m4b", "--pattern", "-p"),
+    ipod: bool = typer.Option(False, "--ipod", help="Re-encode for iPod compatibility"),
+    ipod_preset: PresetChoice = typer.Option(PresetChoice.standard, "--preset"),
+    jobs: int = typer.Option(1, "--jobs", "-j", help="Number of parts to encode in parallel"),
+    threads: int = typer.Option(
+        0, "--threads", help="ffmpeg threads per encode, 0 = auto (tune with --jobs)"
+    ),
+    hwaccel: str = typer.Option(
+        None, "--hwaccel", help="Hardware decode method: vaapi|qsv|videotoolbox|auto"
+    ),
+) -> None:
+    """Split an M4B audiobook file into smaller parts."""
+    dep_result = check_dependencies()
+    if not dep_result.all_found:
+        console.print("[red]Error:[/red] ffmpeg/ffprobe not found!")
+        console.print(format_dependency_check(dep_result))
+        raise typer.Exit(1)
+
+    if hwaccel and hwaccel != "auto":
+        available = get_available_hwaccels()
+        if available and hwaccel not in available:
+            console.print(
+                f"[red]Error:[/red] hwaccel '{hwaccel}' not supported by this ffmpeg "
+                f"(available: {', '.join(sorted(available))})"
+            )
+            raise typer.Exit(1)
+
+    try:
+        max_hours = parse_duration(max_duration)
+        if max_hours <= 0:
+            console.print("[red]Error:[/red] Duration must be positive")
+            raise typer.Exit(1)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+
+    if output_dir is None:
+        output_dir = input_file.parent
+
+    ipod_settings = IPOD_PRESETS.get(ipod_preset.value) if ipod else None
+
+    # Configuration display
+    config_markup = (
+        f"[dim]Input:        [/dim][cyan]{input_file.name}\n[/cyan]"
+        f"[dim]Output Dir:   [/dim][cyan]{output_dir}\n[/cyan]"
+        "[dim]Max Duration: [/dim]"
+        f"[yellow]{max_hours:.2f} hours ({format_time_human(max_hours * 3600)})\n[/yellow]"
+    )
+
+    if ipod and ipod_settings:
+        config_markup += (
+            "[dim]iPod Mode:    [/dim][green]Enabled\n[/green]"
+            f"[dim]Preset:       [/dim][green]{ipod_preset.value}\n[/green]"
+            "[dim]Encoding:     [/dim]"
+            f"[cyan]{ipod_settings.sample_rate}Hz, {ipod_settings.bitrate}kbps, "
+            f"{'mono' if ipod_settings.channels == 1 else 'stereo'}"
+            f"{', CBR' if ipod_settings.use_cbr else ''}\n[/cyan]"
+        )
+    else:
+        config_markup += "[dim]iPod Mode:    Disabled (stream copy)\n[/dim]"
+
+    config_text = Text.from_markup(config_markup)
+    console.print(Panel(config_text, title="Configuration", border_style="blue"))
+    console.print()
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[bold blue]{task.description}"),
+        BarColumn(bar_width=40),
+        TaskProgressColumn(),
+        TimeElapsedColumn(),
+        TimeRemainingColumn(),
+        console=console,
+        transient=False,
+    ) as progress:
+        main_task = progress.add_task("Splitting audiobook...", total=100)
+        ffmpeg_task = progress.add_task("[cyan]Waiting...", total=100, visible=False)
+
+        def render_update(step: str, percent: float, ffmpeg_prog: FFmpegProgress | None) -> None:
+            progress.update(main_task, completed=percent, description=f"[bold blue]{step}")
+
+            if ffmpeg_prog and ffmpeg_prog.percent > 0:
+                progress.update(ffmpeg_task, visible=True)
+                details = []
+                if ffmpeg_prog.speed > 0:
+                    details.append(f"{ffmpeg_prog.speed:.1f}x")
+                if ffmpeg_prog.bitrate_kbps > 0:
+                    details.append(f"{ffmpeg_prog.bitrate_kbps:.0f}kbps")
+                if ffmpeg_prog.size_kb > 0:
+                    details.append(f"{ffmpeg_prog.size_kb / 1024:.1f}MB")
+
+                detail_str = " | ".join(details) if details else ""
+                time_str = format_time_human(ffmpeg_prog.time_seconds)
+
+                progress.update(
+                    ffmpeg_task,
+                    completed=ffmpeg_prog.percent,
+                    description=f"[cyan]  └─ {time_str} encoded {detail_str}",
+                )
+            elif "Processing" not in step and "Encoding" not in step:
+                progress.update(ffmpeg_task, visible=False)
+
+        # Rendering takes a lock and formats strings; do it on a separate
+        # thread so the ffmpeg pipe reader is never blocked by the terminal.
+        updates: queue.Queue = queue.Queue(maxsize=1)
+        done = threading.Event()
+
+        def drain_updates() -> None:
+            while not (done.is_set() and updates.empty()):
+                try:
+                    state = updates.get(timeout=0.03)
+                except queue.Empty:
+                    continue
+                render_update(*state)
+
+        def progress_callback(
+            step: str, percent: float, ffmpeg_prog: FFmpegProgress | None
+        ) -> None:
+            _offer_latest(updates, (step, percent, ffmpeg_prog))
+
+        render_thread = threading.Thread(target=drain_updates, daemon=True)
+        render_thread.start()
+
+        splitter = M4BSplitter()
+        result = splitter.split(
+            input_file=input_file,
+            output_dir=output_dir,
+            max_duration_hours=max_hours,
+            output_pattern=pattern,
+            ipod_mode=ipod,
+            ipod_preset=ipod_preset.value,
+            progress_callback=progress_callback,
+            jobs=jobs,
+            ffmpeg_threads=threads,
+            hwaccel=hwaccel,
+        )
+
+        done.set()
+        render_thread.join(timeout=2)
+        progress.update(ffmpeg_task, visible=False)
+        progress.update(main_task, completed=100)
+
+    console.print()
+
+    if result.success:
+        if result.parts:
+            result_table = Table(
+                title="✓ Split Complete",
+                show_header=True,
+                header_style="bold green",
+            )
+            result_table.add_column("Part", style="cyan", justify="center")
+            result_table.add_column("Duration", justify="right")
+            result_table.add_column("Chapters", justify="center")
+            result_table.add_column("File")
+
+            for part in result.parts:
+                result_table.add_row(
+                    f"{part.part_number}/{part.total_parts}",
+                    format_time_human(part.duration),
+                    str(len(part.chapters)),
+                    part.output_path.name,
+                )
+
+            console.print(result_table)
+            console.print()
+            console.print("[bold]Output files:[/bold]")
+            for path in result.output_files:
+                console.print(f"  [green]✓[/green] {path}")
+        else:
+            console.print(
+                Panel(
+                    f"[yellow]No split needed[/yellow] - file already under {max_hours:.1f} hours",
+                    border_style="yellow",
+                )
+            )
+    else:
+        console.print(
+            Panel(
+                f"[red bold]Error:[/red bold] {result.error_message}",
+                title="Split Failed",
+                border_style="red",
+            )
+        )
+        raise typer.Exit(1)
+
+
+@app.callback(invoke_without_command=True)
+def main_callback(
+    ctx: typer.Context,
+    version: bool = typer.Option(False, "--version", "-v", help="Show version"),
+) -> None:
+    """M4B Splitter - Split audiobook files by chapter."""
+    if version:
+        from m4b_splitter import __version__
+
+        console.print(f"m4b-splitter version {__version__}")
+        raise typer.Exit()
+
+    if ctx.invoked_subcommand is None:
+        console.print(ctx.get_help())
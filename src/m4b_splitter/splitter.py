@@ -1,16 +1,23 @@
 """Core M4B splitting functionality."""
 
+import contextlib
+import functools
+import os
 import re
+import selectors
 import subprocess
 import tempfile
 import threading
+import time
+from collections import deque
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
 from m4b_splitter.models import AudioMetadata, Chapter, SplitPart, SplitResult
-from m4b_splitter.probe import extract_chapters, extract_metadata, validate_m4b_file
+from m4b_splitter.probe import ProbeError, probe_all
 
 
 class SplitterError(Exception):
@@ -62,6 +69,12 @@ class IPodSettings:
     # Preset name for display
     preset_name: str = "custom"
 
+    # Lazily built encoder argument tuple (settings are never mutated
+    # after construction in practice)
+    _cached_audio_args: tuple[str, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @classmethod
     def standard(cls) -> "IPodSettings":
         """Standard audiobook settings (good balance for iPod Classic)."""
@@ -121,28 +134,35 @@ class IPodSettings:
         return max_seconds / 3600
 
     def get_ffmpeg_audio_args(self) -> list[str]:
-        """Get ffmpeg arguments for audio encoding."""
-        args = [
-            "-c:a",
-            self.encoder,
-            "-ar",
-            str(self.sample_rate),
-            "-ac",
-            str(self.channels),
-            "-b:a",
-            f"{self.bitrate}k",
-        ]
+        """Get ffmpeg arguments for audio encoding.
+
+        The argument tuple is computed once per settings object; each call
+        returns a fresh list so callers may extend it freely.
+        """
+        if self._cached_audio_args is None:
+            args = [
+                "-c:a",
+                self.encoder,
+                "-ar",
+                str(self.sample_rate),
+                "-ac",
+                str(self.channels),
+                "-b:a",
+                f"{self.bitrate}k",
+            ]
 
-        # Add CBR mode if requested (mainly for iPod Video compatibility)
-        if self.use_cbr:
-            # For standard aac encoder, use strict CBR
-            args.extend(["-profile:a", "aac_low"])
+            # Add CBR mode if requested (mainly for iPod Video compatibility)
+            if self.use_cbr:
+                # For standard aac encoder, use strict CBR
+                args.extend(["-profile:a", "aac_low"])
 
-        # Add any additional encoder options
-        for key, value in self.encoder_options.items():
-            args.extend([f"-{key}", value])
+            # Add any additional encoder options
+            for key, value in self.encoder_options.items():
+                args.extend([f"-{key}", value])
 
-        return args
+            self._cached_audio_args = tuple(args)
+
+        return list(self._cached_audio_args)
 
     def __str__(self) -> str:
         mode = "CBR" if self.use_cbr else "VBR"
@@ -175,6 +195,14 @@ class FFmpegProgress:
     percent: float = 0.0
 
 
+# Patterns for ffmpeg's human-readable stats line, compiled once; this
+# parser runs per stderr line during an encode.
+_TIME_RE = re.compile(r"time=(\d+):(\d+):(\d+\.?\d*)")
+_SIZE_RE = re.compile(r"size=\s*(\d+)kB")
+_BITRATE_RE = re.compile(r"bitrate=\s*([\d.]+)kbits/s")
+_SPEED_RE = re.compile(r"speed=\s*([\d.]+)x")
+
+
 def parse_ffmpeg_progress(line: str, total_duration: float) -> FFmpegProgress | None:
     """
     Parse ffmpeg progress output line.
@@ -191,8 +219,10 @@ def parse_ffmpeg_progress(line: str, total_duration: float) -> FFmpegProgress |
 
     progress = FFmpegProgress()
 
+    # Each regex is gated on a cheap substring check first
+
     # Parse time (format: HH:MM:SS.ss or N/A)
-    time_match = re.search(r"time=(\d+):(\d+):(\d+\.?\d*)", line)
+    time_match = _TIME_RE.search(line)
     if time_match:
         hours, mins, secs = time_match.groups()
         progress.time_seconds = int(hours) * 3600 + int(mins) * 60 + float(secs)
@@ -200,31 +230,68 @@ def parse_ffmpeg_progress(line: str, total_duration: float) -> FFmpegProgress |
             progress.percent = min(100.0, (progress.time_seconds / total_duration) * 100)
 
     # Parse size
-    size_match = re.search(r"size=\s*(\d+)kB", line)
-    if size_match:
-        progress.size_kb = int(size_match.group(1))
+    if "size=" in line:
+        size_match = _SIZE_RE.search(line)
+        if size_match:
+            progress.size_kb = int(size_match.group(1))
 
     # Parse bitrate
-    bitrate_match = re.search(r"bitrate=\s*([\d.]+)kbits/s", line)
-    if bitrate_match:
-        progress.bitrate_kbps = float(bitrate_match.group(1))
+    if "bitrate=" in line:
+        bitrate_match = _BITRATE_RE.search(line)
+        if bitrate_match:
+            progress.bitrate_kbps = float(bitrate_match.group(1))
 
     # Parse speed
-    speed_match = re.search(r"speed=\s*([\d.]+)x", line)
-    if speed_match:
-        progress.speed = float(speed_match.group(1))
+    if "speed=" in line:
+        speed_match = _SPEED_RE.search(line)
+        if speed_match:
+            progress.speed = float(speed_match.group(1))
 
     return progress
 
 
+# Parsers for ffmpeg's machine-readable `-progress` key=value stream.
+# The dispatch table converts only the fields FFmpegProgress cares about.
+def _set_time_ms(progress: FFmpegProgress, value: str) -> None:
+    progress.time_seconds = int(value) / 1_000_000
+
+
+def _set_total_size(progress: FFmpegProgress, value: str) -> None:
+    progress.size_kb = int(value) // 1024
+
+
+def _set_bitrate(progress: FFmpegProgress, value: str) -> None:
+    if value.endswith("kbits/s"):
+        progress.bitrate_kbps = float(value[:-7])
+
+
+def _set_speed(progress: FFmpegProgress, value: str) -> None:
+    if value.endswith("x"):
+        progress.speed = float(value[:-1])
+
+
+_PROGRESS_SETTERS: dict[str, Callable[[FFmpegProgress, str], None]] = {
+    "out_time_ms": _set_time_ms,
+    "total_size": _set_total_size,
+    "bitrate": _set_bitrate,
+    "speed": _set_speed,
+}
+
+
+@functools.lru_cache(maxsize=4096)
 def format_time(seconds: float) -> str:
-    """Format seconds as HH:MM:SS.mmm for ffmpeg."""
+    """Format seconds as HH:MM:SS.mmm for ffmpeg.
+
+    Cached: chapter boundaries repeat across command building and
+    metadata output (pure function of a hashable float).
+    """
     hours = int(seconds // 3600)
     minutes = int((seconds % 3600) // 60)
     secs = seconds % 60
     return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
 
 
+@functools.lru_cache(maxsize=4096)
 def format_time_human(seconds: float) -> str:
     """Format seconds as human readable string."""
     hours = int(seconds // 3600)
@@ -239,16 +306,15 @@ def format_time_human(seconds: float) -> str:
         return f"{secs}s"
 
 
+# Characters invalid in filenames (Windows superset), each mapped to "_"
+_FILENAME_SANITIZE_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
+
+
 def sanitize_filename(name: str) -> str:
     """Sanitize a string for use in filenames."""
-    # Remove or replace invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', "_", name)
-    # Remove leading/trailing whitespace and dots
-    sanitized = sanitized.strip(". ")
-    # Limit length
-    if len(sanitized) > 200:
-        sanitized = sanitized[:200]
-    return sanitized or "untitled"
+    # Replace invalid characters, trim whitespace/dots, limit length
+    sanitized = name.translate(_FILENAME_SANITIZE_TABLE).strip(". ")
+    return sanitized[:200] or "untitled"
 
 
 def plan_splits(chapters: list[Chapter], max_duration_seconds: float) -> list[list[Chapter]]:
@@ -273,7 +339,10 @@ def plan_splits(chapters: list[Chapter], max_duration_seconds: float) -> list[li
     current_duration = 0.0
 
     for chapter in chapters:
-        chapter_duration = chapter.duration
+        # Inline end - start instead of the duration property: this loop
+        # is pure numeric work, and the property costs a descriptor call
+        # per chapter
+        chapter_duration = chapter.end_time - chapter.start_time
 
         # If adding this chapter would exceed the limit
         if current_duration + chapter_duration > max_duration_seconds and current_part:
@@ -293,6 +362,46 @@ def plan_splits(chapters: list[Chapter], max_duration_seconds: float) -> list[li
     return parts
 
 
+def _available_cpus() -> int:
+    """Number of CPUs actually available to this process.
+
+    Honors the scheduler affinity mask (cgroup/taskset limits) where the
+    platform exposes it, falling back to the raw core count.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # macOS/Windows
+        return os.cpu_count() or 1
+
+
+@functools.lru_cache(maxsize=1)
+def get_available_hwaccels() -> frozenset[str]:
+    """
+    Query ffmpeg for the hardware acceleration methods it supports.
+
+    Returns:
+        Frozenset of method names (e.g. "vaapi"), empty if ffmpeg is
+        missing or the query fails.
+    """
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-hwaccels"],
+            check=False,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return frozenset()
+
+    if result.returncode != 0:
+        return frozenset()
+
+    # First line is the "Hardware acceleration methods:" header
+    lines = result.stdout.splitlines()[1:]
+    return frozenset(line.strip() for line in lines if line.strip())
+
+
 def extract_cover_art(input_file: Path, output_file: Path) -> bool:
     """
     Extract cover art from an M4B file.
@@ -317,11 +426,19 @@ def extract_cover_art(input_file: Path, output_file: Path) -> bool:
 
     try:
         result = subprocess.run(cmd, check=False, capture_output=True, text=True)
-        return result.returncode == 0 and output_file.exists() and output_file.stat().st_size > 0
+        # One stat covers both the existence and the size check
+        return result.returncode == 0 and output_file.stat().st_size > 0
     except Exception:
         return False
 
 
+# ffmetadata escape tables: one translate() pass instead of chained
+# .replace() calls. Tag values also fold newlines; chapter titles keep
+# the historical escape set.
+_META_VALUE_ESCAPE = str.maketrans({"=": "\\=", ";": "\\;", "#": "\\#", "\n": " "})
+_META_TITLE_ESCAPE = str.maketrans({"=": "\\=", ";": "\\;", "#": "\\#"})
+
+
 def create_metadata_file(
     metadata: AudioMetadata,
     chapters: list[Chapter],
@@ -347,57 +464,57 @@ def create_metadata_file(
     # Calculate time offset (chapters in this part start at their original times)
     time_offset = chapters[0].start_time if chapters else 0
 
-    with open(metadata_path, "w", encoding="utf-8") as f:
-        f.write(";FFMETADATA1\n")
-
-        # Write global metadata
-        title = metadata.title or "Audiobook"
-        f.write(f"title={title} - Part {part_number}/{total_parts}\n")
-
-        if metadata.artist:
-            f.write(f"artist={metadata.artist}\n")
-        if metadata.album:
-            f.write(f"album={metadata.album}\n")
-        if metadata.album_artist:
-            f.write(f"album_artist={metadata.album_artist}\n")
-        if metadata.composer:
-            f.write(f"composer={metadata.composer}\n")
-        if metadata.genre:
-            f.write(f"genre={metadata.genre}\n")
-        if metadata.date:
-            f.write(f"date={metadata.date}\n")
-        if metadata.comment:
-            comment = metadata.comment.replace("\n", " ")
-            f.write(f"comment={comment}\n")
-
-        # Track numbering
-        f.write(f"track={part_number}/{total_parts}\n")
-
-        # Write extra tags
-        for key, value in metadata.extra_tags.items():
-            # Escape special characters
-            value = (
-                value.replace("=", "\\=").replace(";", "\\;").replace("#", "\\#").replace("\n", " ")
-            )
-            f.write(f"{key}={value}\n")
-
-        # Write chapter information
-        for chapter in chapters:
-            # Adjust times relative to part start
-            start_ms = int((chapter.start_time - time_offset) * 1000)
-            end_ms = int((chapter.end_time - time_offset) * 1000)
-
-            f.write("\n[CHAPTER]\n")
-            f.write("TIMEBASE=1/1000\n")
-            f.write(f"START={start_ms}\n")
-            f.write(f"END={end_ms}\n")
-            # Escape chapter title
-            ch_title = chapter.title.replace("=", "\\=").replace(";", "\\;").replace("#", "\\#")
-            f.write(f"title={ch_title}\n")
+    # Build the whole file in memory, then write once
+    buf: list[str] = [";FFMETADATA1\n"]
+
+    # Global metadata
+    title = metadata.title or "Audiobook"
+    buf.append(f"title={title} - Part {part_number}/{total_parts}\n")
+
+    if metadata.artist:
+        buf.append(f"artist={metadata.artist}\n")
+    if metadata.album:
+        buf.append(f"album={metadata.album}\n")
+    if metadata.album_artist:
+        buf.append(f"album_artist={metadata.album_artist}\n")
+    if metadata.composer:
+        buf.append(f"composer={metadata.composer}\n")
+    if metadata.genre:
+        buf.append(f"genre={metadata.genre}\n")
+    if metadata.date:
+        buf.append(f"date={metadata.date}\n")
+    if metadata.comment:
+        comment = metadata.comment.replace("\n", " ")
+        buf.append(f"comment={comment}\n")
+
+    # Track numbering
+    buf.append(f"track={part_number}/{total_parts}\n")
+
+    # Extra tags, with special characters escaped
+    for key, value in metadata.extra_tags.items():
+        buf.append(f"{key}={value.translate(_META_VALUE_ESCAPE)}\n")
+
+    # Chapter information
+    for chapter in chapters:
+        # Adjust times relative to part start
+        start_ms = int((chapter.start_time - time_offset) * 1000)
+        end_ms = int((chapter.end_time - time_offset) * 1000)
 
+        buf.append(
+            f"\n[CHAPTER]\nTIMEBASE=1/1000\nSTART={start_ms}\nEND={end_ms}\n"
+            f"title={chapter.title.translate(_META_TITLE_ESCAPE)}\n"
+        )
+
+    # Encode once and write bytes directly: no TextIOWrapper between the
+    # joined buffer and the syscall
+    metadata_path.write_bytes("".join(buf).encode("utf-8"))
     return metadata_path
 
 
+# Buffer size for the ffmpeg stdout/stderr pipes (64 KiB)
+_PIPE_BUFSIZE = 64 * 1024
+
+
 def run_ffmpeg_with_progress(
     cmd: list[str],
     total_duration: float,
@@ -407,64 +524,123 @@ def run_ffmpeg_with_progress(
     Run ffmpeg command with progress tracking.
 
     Args:
-        cmd: FFmpeg command as list of arguments.
+        cmd: FFmpeg command as list of arguments. Progress reporting
+            expects the command to carry ``-progress pipe:1`` already
+            (split_audio_segment builds it into the template).
         total_duration: Total duration in seconds for progress calculation.
         progress_callback: Optional callback for progress updates.
 
     Returns:
         Tuple of (success, error_message).
     """
-    # Add progress flag to ffmpeg command
-    cmd_with_progress = cmd.copy()
-    # Insert -progress pipe:1 after ffmpeg
-    if "ffmpeg" in cmd_with_progress[0]:
-        cmd_with_progress.insert(1, "-progress")
-        cmd_with_progress.insert(2, "pipe:1")
-        cmd_with_progress.insert(3, "-stats_period")
-        cmd_with_progress.insert(4, "0.5")
+    if progress_callback is None:
+        # Fast path: nobody is listening, so skip the reader thread and
+        # the stdout pipe entirely and just wait for the process.
+        try:
+            result = subprocess.run(
+                cmd,
+                check=False,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+        except Exception as e:
+            return False, str(e)
+        if result.returncode != 0:
+            return False, result.stderr
+        return True, ""
 
     try:
+        # Block-buffered pipes: line iteration still yields per line, but
+        # the underlying read() syscalls are batched instead of one per
+        # line. 64 KiB drains a chatty stderr burst in one syscall.
+        # Encoding is pinned so no locale probe happens per stream.
         process = subprocess.Popen(
-            cmd_with_progress,
+            cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
-            bufsize=1,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=_PIPE_BUFSIZE,
         )
 
-        stderr_lines: list[str] = []
-
-        def read_stderr():
-            if process.stderr:
+        # Keep only the tail of stderr: a failing encode's useful error is
+        # at the end, and long runs would otherwise grow this unbounded.
+        stderr_lines: deque[str] = deque(maxlen=512)
+        current = FFmpegProgress()
+
+        # Throttle emissions to >=100ms apart: ffmpeg can report far
+        # faster than any UI usefully renders. The 100% report always
+        # goes through so the bar finishes cleanly.
+        last_emit = 0.0
+
+        def emit(prog: FFmpegProgress) -> None:
+            nonlocal last_emit
+            now = time.monotonic()
+            if now - last_emit >= 0.1 or prog.percent >= 100.0:
+                last_emit = now
+                progress_callback(prog)
+
+        # The -progress stream on stdout is authoritative (and -nostats
+        # keeps stats lines off stderr anyway), so stderr is only
+        # collected for error reporting — no per-line regex parsing.
+        def handle_stderr_line(line: str) -> None:
+            stderr_lines.append(line)
+
+        def handle_stdout_line(line: str) -> None:
+            # One line of the -progress key=value stream
+            nonlocal current
+            key, sep, value = line.partition("=")
+            if not sep:
+                return
+            if key == "progress":
+                # "progress=continue|end" terminates each report block
+                if total_duration > 0:
+                    current.percent = min(
+                        100.0, (current.time_seconds / total_duration) * 100
+                    )
+                emit(current)
+                # A fresh instance per emitted block: the callback may
+                # hand the object to another thread, so it must never be
+                # mutated after emission.
+                current = FFmpegProgress()
+                return
+            setter = _PROGRESS_SETTERS.get(key)
+            if setter:
+                # fields can be "N/A" early in the encode
+                with contextlib.suppress(ValueError):
+                    setter(current, value.strip())
+
+        if os.name == "posix":
+            # One selector multiplexes both pipes on the calling thread:
+            # no stderr drain thread, no join at shutdown.
+            with selectors.DefaultSelector() as selector:
+                selector.register(process.stdout, selectors.EVENT_READ, handle_stdout_line)
+                selector.register(process.stderr, selectors.EVENT_READ, handle_stderr_line)
+                while selector.get_map():
+                    for ready, _ in selector.select():
+                        line = ready.fileobj.readline()
+                        if line:
+                            ready.data(line)
+                        else:
+                            selector.unregister(ready.fileobj)
+        else:
+            # Windows select() can't watch pipes; fall back to a drain
+            # thread for stderr while the main thread reads stdout.
+            def read_stderr() -> None:
                 for line in process.stderr:
-                    stderr_lines.append(line)
-                    if progress_callback:
-                        progress = parse_ffmpeg_progress(line, total_duration)
-                        if progress:
-                            progress_callback(progress)
-
-        # Read stderr in a separate thread
-        stderr_thread = threading.Thread(target=read_stderr)
-        stderr_thread.start()
-
-        # Also read stdout for progress info
-        if process.stdout:
+                    handle_stderr_line(line)
+
+            stderr_thread = threading.Thread(target=read_stderr)
+            stderr_thread.start()
             for line in process.stdout:
-                if progress_callback and "out_time_ms=" in line:
-                    try:
-                        time_ms = int(line.split("=")[1].strip())
-                        progress = FFmpegProgress()
-                        progress.time_seconds = time_ms / 1_000_000
-                        if total_duration > 0:
-                            progress.percent = min(
-                                100.0, (progress.time_seconds / total_duration) * 100
-                            )
-                        progress_callback(progress)
-                    except (ValueError, IndexError):
-                        pass
+                handle_stdout_line(line)
+            stderr_thread.join(timeout=5)
 
         process.wait()
-        stderr_thread.join(timeout=5)
 
         if process.returncode != 0:
             return False, "".join(stderr_lines)
@@ -475,6 +651,28 @@ def run_ffmpeg_with_progress(
         return False, str(e)
 
 
+# Constant argument runs of the split command, hoisted so each part
+# unpacks them instead of rebuilding small lists. Input indices are
+# fixed: 0 = audio, 1 = metadata file, 2 = cover art (when present).
+_PROGRESS_ARGS = ("-progress", "pipe:1", "-stats_period", "0.5", "-nostats")
+# Copy mode shifts timestamps so the keyframe fast seek can't leave the
+# first packet with a negative PTS that some players reject.
+_COPY_AUDIO_ARGS = ("-c:a", "copy", "-avoid_negative_ts", "make_zero")
+_COVER_MAP_ARGS = ("-map", "2:v:0", "-c:v", "copy", "-disposition:v:0", "attached_pic")
+# Metadata/chapters come from input 1; faststart keeps the moov atom up
+# front for streaming/seeking.
+_CMD_TAIL = (
+    "-map_metadata",
+    "1",
+    "-map_chapters",
+    "1",
+    "-movflags",
+    "+faststart",
+    "-f",
+    "ipod",
+)
+
+
 def split_audio_segment(
     input_file: Path,
     output_file: Path,
@@ -484,6 +682,8 @@ def split_audio_segment(
     cover_file: Path | None = None,
     ipod_settings: IPodSettings | None = None,
     progress_callback: Callable[[FFmpegProgress], None] | None = None,
+    ffmpeg_threads: int = 0,
+    hwaccel: str | None = None,
 ) -> tuple[bool, str]:
     """
     Split a segment from an M4B file.
@@ -497,6 +697,9 @@ def split_audio_segment(
         cover_file: Optional cover art file.
         ipod_settings: Optional iPod-compatible encoding settings.
         progress_callback: Optional callback for progress updates.
+        ffmpeg_threads: Thread count passed to ffmpeg (0 = let ffmpeg decide).
+        hwaccel: Optional hardware decode method (e.g. "vaapi", "qsv",
+            "videotoolbox", "auto") forwarded to ffmpeg.
 
     Returns:
         Tuple of (success, error_message).
@@ -505,22 +708,41 @@ def split_audio_segment(
 
     # Build ffmpeg command
     # Key fix: We need to properly handle metadata and chapters for EVERY part
-    cmd = [
-        "ffmpeg",
-        "-y",
-        "-ss",
-        format_time(start_time),
-        "-i",
-        str(input_file),
-        "-i",
-        str(metadata_file),
-    ]
+    # Progress flags go straight into the template (machine-readable
+    # reports on stdout, human stats banner off stderr) so the runner
+    # doesn't have to copy and splice the list afterwards. With no
+    # listener there is no reason to generate report traffic at all.
+    cmd = ["ffmpeg"]
+    if progress_callback is not None:
+        cmd.extend(_PROGRESS_ARGS)
+    cmd.append("-y")
+
+    # Hardware-accelerated decode; must precede the input it applies to
+    if hwaccel:
+        cmd.extend(["-hwaccel", hwaccel])
+
+    # In copy mode, skip the accurate (demux-and-discard) seek and land on
+    # the nearest keyframe — AAC audiobooks have frequent keyframes, so the
+    # alignment loss at a chapter boundary is inaudible. Re-encode mode
+    # keeps accurate seek since decoding covers the sub-keyframe gap.
+    if ipod_settings is None:
+        cmd.append("-noaccurate_seek")
+
+    cmd.extend(
+        [
+            "-ss",
+            format_time(start_time),
+            "-i",
+            str(input_file),
+            "-i",
+            str(metadata_file),
+        ]
+    )
 
-    # Add cover art input if available
-    cover_input_idx = 2
-    if cover_file and cover_file.exists():
+    # Add cover art input if available (checked once, reused for -map below)
+    has_cover = cover_file is not None and cover_file.exists()
+    if has_cover:
         cmd.extend(["-i", str(cover_file)])
-        cover_input_idx = 2
 
     # Duration
     cmd.extend(["-t", format_time(duration)])
@@ -529,42 +751,23 @@ def split_audio_segment(
     if ipod_settings:
         # Re-encode for iPod compatibility
         cmd.extend(ipod_settings.get_ffmpeg_audio_args())
+        # AAC encoders default to few threads; let users open that up
+        cmd.extend(["-threads", str(ffmpeg_threads)])
     else:
         # Copy audio stream without re-encoding (fast, lossless)
-        cmd.extend(["-c:a", "copy"])
+        cmd.extend(_COPY_AUDIO_ARGS)
 
     # Map audio from input file
     cmd.extend(["-map", "0:a:0"])
 
     # Map cover art if available
-    if cover_file and cover_file.exists():
-        cmd.extend(
-            [
-                "-map",
-                f"{cover_input_idx}:v:0",
-                "-c:v",
-                "copy",
-                "-disposition:v:0",
-                "attached_pic",
-            ]
-        )
+    if has_cover:
+        cmd.extend(_COVER_MAP_ARGS)
 
-    # Apply metadata from metadata file
+    # Metadata, chapters, faststart and output format
     # This is the key fix: map_metadata and map_chapters from the metadata file (input 1)
-    cmd.extend(
-        [
-            "-map_metadata",
-            "1",
-            "-map_chapters",
-            "1",
-        ]
-    )
-
-    # Ensure faststart for better streaming/seeking
-    cmd.extend(["-movflags", "+faststart"])
-
-    # Output format
-    cmd.extend(["-f", "ipod", str(output_file)])
+    cmd.extend(_CMD_TAIL)
+    cmd.append(str(output_file))
 
     return run_ffmpeg_with_progress(cmd, duration, progress_callback)
 
@@ -591,6 +794,9 @@ class M4BSplitter:
         ipod_mode: bool = False,
         ipod_preset: str = "standard",
         progress_callback: (Callable[[str, float, FFmpegProgress | None], None] | None) = None,
+        jobs: int = 1,
+        ffmpeg_threads: int = 0,
+        hwaccel: str | None = None,
     ) -> SplitResult:
         """
         Split an M4B file into parts based on maximum duration.
@@ -604,6 +810,10 @@ class M4BSplitter:
             ipod_mode: If True, re-encode audio for iPod compatibility.
             ipod_preset: iPod encoding preset ('standard', 'high', 'extended', 'video').
             progress_callback: Optional callback(step_name, overall_percent, ffmpeg_progress)
+            jobs: Number of parts to encode concurrently (1 = sequential,
+                0 = one worker per CPU core).
+            ffmpeg_threads: Thread count for ffmpeg when re-encoding (0 = auto).
+            hwaccel: Optional ffmpeg hardware decode method (e.g. "vaapi").
 
         Returns:
             SplitResult containing information about the split.
@@ -624,20 +834,35 @@ class M4BSplitter:
             ipod_settings = IPOD_PRESETS.get(ipod_preset, IPodSettings.standard())
 
         try:
-            # Step 1: Validate input file
+            # Steps 1-3: one probe yields validity, metadata and chapters
+            # (probe_file additionally memoizes per (path, mtime, size),
+            # so repeated split calls on the same file skip ffprobe too)
             report_progress("Validating input file", 0)
 
-            is_valid, msg = validate_m4b_file(input_file)
+            try:
+                chapters, metadata, (is_valid, msg) = probe_all(input_file)
+            except ProbeError as e:
+                raise SplitterError(f"Invalid input file: {e}") from e
             if not is_valid:
                 raise SplitterError(f"Invalid input file: {msg}")
 
-            # Step 2: Extract metadata
             report_progress("Extracting metadata", 5)
-            metadata = extract_metadata(input_file)
+
+            # If the source stream already satisfies the iPod preset, a
+            # lossless stream copy yields a compliant file at demux speed
+            # — skip the CPU-bound re-encode entirely.
+            if (
+                ipod_settings is not None
+                and metadata.codec == "aac"
+                and metadata.sample_rate == ipod_settings.sample_rate
+                and metadata.channels == ipod_settings.channels
+                and abs(metadata.bit_rate // 1000 - ipod_settings.bitrate) < 8
+            ):
+                report_progress("iPod preset matches source; using stream copy", 8)
+                ipod_settings = None
 
             # Step 3: Extract chapters
             report_progress("Extracting chapters", 10)
-            chapters = extract_chapters(input_file)
 
             # Step 4: Plan splits
             report_progress("Planning splits", 15)
@@ -675,21 +900,28 @@ class M4BSplitter:
                     cover_file = None
 
                 # Step 6: Split audio - this is the main work
+                # Each part gets its own ffmpeg invocation (rather than one
+                # pass through the segment muxer) because every output must
+                # carry its own rewritten chapters, part-numbered title and
+                # cover art, which -f segment cannot attach per segment.
                 parts: list[SplitPart] = []
                 base_progress = 20
                 progress_per_part = 75 / total_parts  # Reserve 20-95% for splitting
 
-                for part_num, part_chapters in enumerate(split_plan, 1):
-                    part_base_progress = base_progress + (part_num - 1) * progress_per_part
-
-                    # Generate output filename
-                    title = sanitize_filename(metadata.title or input_file.stem)
-                    artist = sanitize_filename(metadata.artist or "Unknown")
+                # Filename components shared by every part; sanitize once
+                # outside the loop
+                title = sanitize_filename(metadata.title or input_file.stem)
+                artist = sanitize_filename(metadata.artist or "Unknown")
 
+                # Plan all parts up-front so they can be encoded in any order
+                part_plans: list[tuple[int, list[Chapter], Path, Path]] = []
+                for part_num, part_chapters in enumerate(split_plan, 1):
                     filename = output_pattern.format(
                         title=title, part=part_num, total=total_parts, artist=artist
                     )
-                    # Sanitize the final filename
+                    # Title and artist are already clean, but the pattern
+                    # itself can still introduce invalid characters,
+                    # stray trailing dots/spaces or an over-long name
                     filename = sanitize_filename(filename)
                     if not filename.endswith(".m4b"):
                         filename += ".m4b"
@@ -706,44 +938,85 @@ class M4BSplitter:
                         temp_dir=temp_path,
                     )
 
-                    # Extract this part
-                    start_time = part_chapters[0].start_time
-                    end_time = part_chapters[-1].end_time
+                    part_plans.append((part_num, part_chapters, output_file, metadata_file))
 
-                    def ffmpeg_progress_handler(prog: FFmpegProgress) -> None:
-                        # Convert ffmpeg progress to overall progress
-                        part_progress = prog.percent / 100 * progress_per_part
-                        overall = part_base_progress + part_progress
-                        report_progress(f"Encoding part {part_num}/{total_parts}", overall, prog)
-
-                    report_progress(f"Processing part {part_num}/{total_parts}", part_base_progress)
+                def encode_part(
+                    plan: tuple[int, list[Chapter], Path, Path],
+                    ffmpeg_callback: Callable[[FFmpegProgress], None] | None = None,
+                ) -> SplitPart:
+                    part_num, part_chapters, output_file, metadata_file = plan
 
                     success, error = split_audio_segment(
                         input_file=input_file,
                         output_file=output_file,
-                        start_time=start_time,
-                        end_time=end_time,
+                        start_time=part_chapters[0].start_time,
+                        end_time=part_chapters[-1].end_time,
                         metadata_file=metadata_file,
                         cover_file=cover_file,
                         ipod_settings=ipod_settings,
-                        progress_callback=ffmpeg_progress_handler,
+                        progress_callback=ffmpeg_callback,
+                        ffmpeg_threads=ffmpeg_threads,
+                        hwaccel=hwaccel,
                     )
 
                     if not success:
                         raise SplitterError(f"Failed to create part {part_num}: {error}")
 
-                    if not output_file.exists():
-                        raise SplitterError(f"Output file was not created: {output_file}")
+                    # A zero returncode means ffmpeg wrote the output; no
+                    # need to stat it again here
 
-                    parts.append(
-                        SplitPart(
-                            part_number=part_num,
-                            total_parts=total_parts,
-                            chapters=part_chapters,
-                            output_path=output_file,
-                        )
+                    return SplitPart(
+                        part_number=part_num,
+                        total_parts=total_parts,
+                        chapters=part_chapters,
+                        output_path=output_file,
                     )
 
+                # Resolve requested concurrency: 0 = one worker per core,
+                # never more workers than parts.
+                max_workers = jobs if jobs > 0 else _available_cpus()
+                max_workers = min(max_workers, total_parts)
+
+                # With several encoders running at once, divide the CPU
+                # budget between them instead of letting each ffmpeg spawn
+                # per-core threads and oversubscribe the machine. Serial
+                # runs keep 0 (ffmpeg auto-sizes to all cores).
+                if ffmpeg_threads == 0 and max_workers > 1:
+                    ffmpeg_threads = max(1, _available_cpus() // max_workers)
+
+                if max_workers > 1:
+                    # Encode parts concurrently. Per-ffmpeg progress would
+                    # interleave between workers, so report per completed part.
+                    completed = 0
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        futures = [executor.submit(encode_part, plan) for plan in part_plans]
+                        for future in as_completed(futures):
+                            parts.append(future.result())
+                            completed += 1
+                            report_progress(
+                                f"Encoded part {completed}/{total_parts}",
+                                base_progress + completed * progress_per_part,
+                            )
+                    parts.sort(key=lambda part: part.part_number)
+                else:
+                    for plan in part_plans:
+                        part_num = plan[0]
+                        part_base_progress = base_progress + (part_num - 1) * progress_per_part
+
+                        def ffmpeg_progress_handler(prog: FFmpegProgress) -> None:
+                            # Convert ffmpeg progress to overall progress
+                            part_progress = prog.percent / 100 * progress_per_part
+                            overall = part_base_progress + part_progress
+                            report_progress(
+                                f"Encoding part {part_num}/{total_parts}", overall, prog
+                            )
+
+                        report_progress(
+                            f"Processing part {part_num}/{total_parts}", part_base_progress
+                        )
+
+                        parts.append(encode_part(plan, ffmpeg_progress_handler))
+
                 report_progress("Finalizing", 98)
 
             report_progress("Complete", 100)
@@ -781,6 +1054,9 @@ def split_m4b(
     ipod_mode: bool = False,
     ipod_preset: str = "standard",
     progress_callback: (Callable[[str, float, FFmpegProgress | None], None] | None) = None,
+    jobs: int = 1,
+    ffmpeg_threads: int = 0,
+    hwaccel: str | None = None,
 ) -> SplitResult:
     """
     Convenience function to split an M4B file.
@@ -799,6 +1075,10 @@ def split_m4b(
             - 'extended': 16000Hz, 48kbps mono (max ~74h per file)
             - 'video': 44100Hz, 80kbps CBR mono (iPod Video 5th Gen compatible)
         progress_callback: Optional callback(step_name, overall_percent, ffmpeg_progress)
+        jobs: Number of parts to encode concurrently (1 = sequential,
+                0 = one worker per CPU core).
+        ffmpeg_threads: Thread count for ffmpeg when re-encoding (0 = auto).
+        hwaccel: Optional ffmpeg hardware decode method (e.g. "vaapi").
 
     Returns:
         SplitResult containing information about the split.
@@ -812,4 +1092,7 @@ def split_m4b(
         ipod_mode=ipod_mode,
         ipod_preset=ipod_preset,
         progress_callback=progress_callback,
+        jobs=jobs,
+        ffmpeg_threads=ffmpeg_threads,
+        hwaccel=hwaccel,
     )
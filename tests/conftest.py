@@ -1,6 +1,8 @@
 """Shared pytest fixtures and configuration."""
 
-import sys
+import os
+import shutil
+import subprocess
 from pathlib import Path
 
 import pytest
@@ -9,8 +11,28 @@ from m4b_splitter.dependencies import check_dependencies
 from m4b_splitter.models import AudioMetadata, Chapter
 from tests.test_utils import create_test_m4b
 
-# Ensure the package is importable
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Pre-generated source files (see tests/fixtures/generate.py); preferred
+# over a cold ffmpeg encode when present.
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_ffmpeg():
+    """Warm the ffmpeg/ffprobe binaries once per session.
+
+    A throwaway ``-version`` run pulls the executables and their shared
+    libraries into the page cache, so the first real test does not pay
+    the cold-start cost. No-op when the tools are not installed.
+    """
+    deps = check_dependencies()
+    for tool in (deps.ffmpeg, deps.ffprobe):
+        if tool.found and tool.path:
+            subprocess.run(
+                [tool.path, "-version"],
+                check=False,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
 
 
 @pytest.fixture
@@ -21,22 +43,26 @@ def tmp_m4b_dir(tmp_path):
     return m4b_dir
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_chapters():
-    """Create sample chapters for testing."""
+    """Create sample chapters for testing (shared across the session).
+
+    Returned as a tuple so accidental mutation by one test cannot leak
+    into another; take a list(...) copy where a mutable list is needed.
+    """
 
-    return [
+    return (
         Chapter(id=0, title="Introduction", start_time=0.0, end_time=60.0),
         Chapter(id=1, title="Chapter 1", start_time=60.0, end_time=180.0),
         Chapter(id=2, title="Chapter 2", start_time=180.0, end_time=300.0),
         Chapter(id=3, title="Chapter 3", start_time=300.0, end_time=420.0),
         Chapter(id=4, title="Conclusion", start_time=420.0, end_time=480.0),
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_metadata():
-    """Create sample metadata for testing."""
+    """Create sample metadata for testing (shared across the session)."""
 
     return AudioMetadata(
         title="Sample Audiobook",
@@ -53,15 +79,68 @@ def sample_metadata():
     )
 
 
+@pytest.fixture(scope="session")
+def m4b_factory(tmp_path_factory):
+    """Memoized test-file builder: one ffmpeg encode per file shape.
+
+    Tests only read the source files, never mutate them, so a single
+    file per (num_chapters, chapter_duration) pair can serve every test
+    in the session instead of re-encoding per test.
+
+    Safe under pytest-xdist (``-n auto --dist loadscope``): the cache
+    directory is shared by all workers, and each build lands via an
+    atomic rename, so concurrent workers at worst encode the same file
+    twice rather than read a half-written one.
+    """
+    # getbasetemp() is per-worker under xdist (".../popen-gwN"); its
+    # parent is common to every worker of the run.
+    base = tmp_path_factory.getbasetemp()
+    if base.name.startswith("popen-"):
+        base = base.parent
+    cache_dir = base / "m4b_shared"
+    cache_dir.mkdir(exist_ok=True)
+    built: dict[tuple[int, float], Path | None] = {}
+
+    # check_dependencies is cached, so this reuses the resolution done
+    # for the module-level skipif; passing the absolute path down spares
+    # a PATH search per ffmpeg spawn.
+    ffmpeg_bin = check_dependencies().ffmpeg.path or "ffmpeg"
+
+    def make(num_chapters: int, chapter_duration: float) -> Path:
+        key = (num_chapters, chapter_duration)
+        if key not in built:
+            path = cache_dir / f"test_{num_chapters}ch_{chapter_duration:g}s.m4b"
+            if not path.exists():
+                tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                fixture = FIXTURE_DIR / path.name
+                if fixture.exists():
+                    # Checked-in blob: a copy beats a cold encode
+                    shutil.copy(fixture, tmp)
+                    tmp.replace(path)
+                elif create_test_m4b(
+                    tmp,
+                    num_chapters=num_chapters,
+                    chapter_duration=chapter_duration,
+                    ffmpeg_bin=ffmpeg_bin,
+                ):
+                    tmp.replace(path)
+                else:
+                    tmp.unlink(missing_ok=True)
+            built[key] = path if path.exists() else None
+        path = built[key]
+        if path is None:
+            pytest.skip("Could not create test M4B file")
+        return path
+
+    return make
+
+
 @pytest.fixture
-def test_m4b_file(tmp_path):
+def test_m4b_file(m4b_factory):
     """Create a test M4B file fixture."""
 
     # Skip if ffmpeg not available
     if not check_dependencies().all_found:
         pytest.skip("ffmpeg not available")
 
-    m4b_path = tmp_path / "test.m4b"
-    if create_test_m4b(m4b_path, num_chapters=4, chapter_duration=30.0):
-        return m4b_path
-    pytest.skip("Could not create test M4B file")
+    return m4b_factory(4, 30.0)
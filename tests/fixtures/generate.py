@@ -0,0 +1,43 @@
+"""One-time generator for the checked-in M4B test fixtures.
+
+Run from the repository root (requires ffmpeg):
+
+    python tests/fixtures/generate.py
+
+Produces one silent-audio M4B per canonical shape used by the
+integration suite. The conftest m4b_factory prefers these blobs over
+encoding from scratch, so a fresh test session pays a file copy instead
+of a cold ffmpeg encode; when a blob is missing the factory still falls
+back to encoding it locally.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from tests.test_utils import create_test_m4b
+
+# (num_chapters, chapter_duration) shapes the integration tests consume
+SHAPES = [(1, 4.0), (2, 2.0), (4, 2.0), (5, 2.0), (10, 1.0)]
+
+FIXTURE_DIR = Path(__file__).parent
+
+
+def main() -> int:
+    failed = 0
+    for num_chapters, chapter_duration in SHAPES:
+        path = FIXTURE_DIR / f"test_{num_chapters}ch_{chapter_duration:g}s.m4b"
+        if create_test_m4b(
+            path, num_chapters=num_chapters, chapter_duration=chapter_duration
+        ):
+            print(f"wrote {path.name} ({path.stat().st_size} bytes)")
+        else:
+            print(f"FAILED {path.name}", file=sys.stderr)
+            failed += 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,12 +1,7 @@
 """Unit tests for the CLI module."""
 
-import sys
-from pathlib import Path
-
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from m4b_splitter.cli import RICH_AVAILABLE, app, parse_duration
 
 
@@ -98,6 +93,21 @@ class TestParseDuration:
         result = parse_duration("-8")
         assert result == -8.0
 
+    def test_parse_signed_with_suffix(self):
+        """Test that a leading sign works on suffixed forms too."""
+        assert parse_duration("-5h") == -5.0
+        assert parse_duration("+5h") == 5.0
+        assert parse_duration("-2h30m") == -2.5
+
+    def test_parse_bare_leading_point(self):
+        """Test that a fraction without a leading zero parses."""
+        assert parse_duration(".5") == 0.5
+        assert parse_duration(".5h") == 0.5
+
+    def test_parse_combined_with_internal_space(self):
+        """Test that a space between components is tolerated."""
+        assert parse_duration("2h 30m") == 2.5
+
 
 class TestCLIHelpers:
     """Additional CLI helper tests."""
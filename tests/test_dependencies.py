@@ -1,11 +1,9 @@
 """Unit tests for the dependencies module."""
 
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock, patch
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 import subprocess
+from unittest.mock import MagicMock, mock_open, patch
+
+import pytest
 
 from m4b_splitter.dependencies import (
     DependencyCheckResult,
@@ -17,9 +15,18 @@ from m4b_splitter.dependencies import (
     format_dependency_check,
     get_installation_instructions,
     get_version,
+    invalidate_dependency_cache,
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_dependency_caches():
+    """Clear memoized dependency lookups so per-test mocks take effect."""
+    invalidate_dependency_cache()
+    yield
+    invalidate_dependency_cache()
+
+
 class TestOSType:
     """Tests for the OSType enum."""
 
@@ -144,51 +151,35 @@ class TestDetectOS:
         assert "Windows" in os_name
 
     @patch("platform.system")
-    @patch("builtins.open")
-    def test_detect_ubuntu(self, mock_open, mock_system):
+    def test_detect_ubuntu(self, mock_system):
         """Test detecting Ubuntu."""
         mock_system.return_value = "Linux"
-        mock_open.return_value.__enter__.return_value = iter(
-            [
-                "ID=ubuntu\n",
-                "ID_LIKE=debian\n",
-                'PRETTY_NAME="Ubuntu 24.04 LTS"\n',
-            ]
-        )
+        os_release = 'ID=ubuntu\nID_LIKE=debian\nPRETTY_NAME="Ubuntu 24.04 LTS"\n'
 
-        os_type, os_name = detect_os()
+        with patch("builtins.open", mock_open(read_data=os_release)):
+            os_type, os_name = detect_os()
 
         assert os_type == OSType.LINUX_DEBIAN
 
     @patch("platform.system")
-    @patch("builtins.open")
-    def test_detect_fedora(self, mock_open, mock_system):
+    def test_detect_fedora(self, mock_system):
         """Test detecting Fedora."""
         mock_system.return_value = "Linux"
-        mock_open.return_value.__enter__.return_value = iter(
-            [
-                "ID=fedora\n",
-                'PRETTY_NAME="Fedora Linux 39"\n',
-            ]
-        )
+        os_release = 'ID=fedora\nPRETTY_NAME="Fedora Linux 39"\n'
 
-        os_type, os_name = detect_os()
+        with patch("builtins.open", mock_open(read_data=os_release)):
+            os_type, os_name = detect_os()
 
         assert os_type == OSType.LINUX_REDHAT
 
     @patch("platform.system")
-    @patch("builtins.open")
-    def test_detect_arch(self, mock_open, mock_system):
+    def test_detect_arch(self, mock_system):
         """Test detecting Arch Linux."""
         mock_system.return_value = "Linux"
-        mock_open.return_value.__enter__.return_value = iter(
-            [
-                "ID=arch\n",
-                'PRETTY_NAME="Arch Linux"\n',
-            ]
-        )
+        os_release = 'ID=arch\nPRETTY_NAME="Arch Linux"\n'
 
-        os_type, os_name = detect_os()
+        with patch("builtins.open", mock_open(read_data=os_release)):
+            os_type, os_name = detect_os()
 
         assert os_type == OSType.LINUX_ARCH
 
@@ -395,3 +386,19 @@ class TestCheckDependencies:
         assert isinstance(result, DependencyCheckResult)
         assert result.os_type == OSType.LINUX_DEBIAN
         assert result.os_name == "Ubuntu 24.04"
+
+    @patch("m4b_splitter.dependencies.detect_os")
+    @patch("m4b_splitter.dependencies.check_dependency")
+    def test_check_dependencies_is_cached(self, mock_check, mock_detect):
+        """Test that repeated calls reuse the cached result."""
+        mock_detect.return_value = (OSType.LINUX_DEBIAN, "Ubuntu 24.04")
+        mock_check.side_effect = [
+            DependencyStatus(name="ffmpeg", found=True, path="/usr/bin/ffmpeg"),
+            DependencyStatus(name="ffprobe", found=True, path="/usr/bin/ffprobe"),
+        ]
+
+        first = check_dependencies()
+        second = check_dependencies()
+
+        assert first is second
+        assert mock_detect.call_count == 1
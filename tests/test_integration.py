@@ -3,13 +3,8 @@
 These tests require ffmpeg to be installed and create actual M4B files.
 """
 
-import sys
-from pathlib import Path
-
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from m4b_splitter import (
     M4BSplitter,
     check_dependencies,
@@ -18,8 +13,7 @@ from m4b_splitter import (
     split_m4b,
     validate_m4b_file,
 )
-from m4b_splitter.probe import probe_file
-from tests.test_utils import create_test_m4b
+from m4b_splitter.probe import probe_all, probe_file
 
 
 def ffmpeg_available() -> bool:
@@ -36,12 +30,9 @@ class TestProbeIntegration:
     """Integration tests for probing M4B files."""
 
     @pytest.fixture
-    def test_m4b(self, tmp_path):
-        """Create a test M4B file."""
-        m4b_path = tmp_path / "test.m4b"
-        if create_test_m4b(m4b_path, num_chapters=5, chapter_duration=30.0):
-            return m4b_path
-        pytest.skip("Could not create test M4B file")
+    def test_m4b(self, m4b_factory):
+        """Shared 5-chapter/2s source file (encoded once per session)."""
+        return m4b_factory(5, 2.0)
 
     def test_probe_file(self, test_m4b):
         """Test probing an M4B file returns valid data."""
@@ -52,6 +43,15 @@ class TestProbeIntegration:
         assert "chapters" in data
         assert len(data["chapters"]) == 5
 
+    def test_probe_all(self, test_m4b):
+        """Test the combined single-probe extraction."""
+        chapters, meta, (is_valid, msg) = probe_all(test_m4b)
+
+        assert len(chapters) == 5
+        assert meta.title == "Test Audiobook"
+        assert is_valid
+        assert "5 chapters" in msg
+
     def test_extract_chapters(self, test_m4b):
         """Test extracting chapters from M4B file."""
         chapters = extract_chapters(test_m4b)
@@ -59,7 +59,7 @@ class TestProbeIntegration:
         assert len(chapters) == 5
         assert chapters[0].title == "Chapter 1"
         assert chapters[0].start_time == 0.0
-        assert chapters[0].duration == 30.0
+        assert chapters[0].duration == 2.0
 
     def test_extract_metadata(self, test_m4b):
         """Test extracting metadata from M4B file."""
@@ -67,7 +67,7 @@ class TestProbeIntegration:
 
         assert meta.title == "Test Audiobook"
         assert meta.artist == "Test Author"
-        assert meta.duration == pytest.approx(150.0, abs=1.0)  # 5 * 30s
+        assert meta.duration == pytest.approx(10.0, abs=1.0)  # 5 * 2s
 
     def test_validate_m4b(self, test_m4b):
         """Test M4B validation."""
@@ -89,19 +89,16 @@ class TestSplitIntegration:
     """Integration tests for splitting M4B files."""
 
     @pytest.fixture
-    def test_m4b(self, tmp_path):
-        """Create a test M4B file with 4 chapters of 30s each."""
-        m4b_path = tmp_path / "test.m4b"
-        if create_test_m4b(m4b_path, num_chapters=4, chapter_duration=30.0):
-            return m4b_path
-        pytest.skip("Could not create test M4B file")
+    def test_m4b(self, m4b_factory):
+        """Shared 4-chapter/2s source file (encoded once per session)."""
+        return m4b_factory(4, 2.0)
 
     def test_split_basic(self, test_m4b, tmp_path):
         """Test basic splitting functionality."""
         output_dir = tmp_path / "output"
 
-        # 4 chapters of 30s each, max 65s = 2 parts with 2 chapters each
-        result = split_m4b(test_m4b, output_dir, max_duration_hours=65 / 3600)
+        # 4 chapters of 2s each, max 4.5s = 2 parts with 2 chapters each
+        result = split_m4b(test_m4b, output_dir, max_duration_hours=4.5 / 3600)
 
         assert result.success
         assert len(result.parts) == 2
@@ -110,18 +107,23 @@ class TestSplitIntegration:
         for path in result.output_files:
             assert path.exists()
 
-    def test_split_preserves_metadata_all_parts(self, test_m4b, tmp_path):
-        """Test that metadata is preserved in ALL output files."""
+    def test_split_preserves_metadata_and_chapters_all_parts(self, test_m4b, tmp_path):
+        """Test that metadata AND chapters are preserved in ALL output files.
+
+        One split run serves both checks; splitting twice only to probe
+        the same outputs doubled the slowest part of this class.
+        """
         output_dir = tmp_path / "output"
 
         result = split_m4b(
-            test_m4b, output_dir, max_duration_hours=65 / 3600  # Creates 2 parts
+            test_m4b, output_dir, max_duration_hours=4.5 / 3600  # Creates 2 parts
         )
 
         assert result.success
         assert len(result.parts) == 2
 
-        # Check BOTH output files have correct metadata
+        # Check EACH output file's metadata, and the planned chapter
+        # assignment from the result itself (no probe needed for that)
         for i, output_file in enumerate(result.output_files, 1):
             meta = extract_metadata(output_file)
 
@@ -131,44 +133,22 @@ class TestSplitIntegration:
             # Artist should be preserved
             assert meta.artist == "Test Author", f"Part {i} artist not preserved"
 
-    def test_split_preserves_chapters_all_parts(self, test_m4b, tmp_path):
-        """Test that chapters are preserved in ALL output files."""
-        output_dir = tmp_path / "output"
+        assert result.parts[0].chapter_titles == ["Chapter 1", "Chapter 2"]
+        assert result.parts[1].chapter_titles == ["Chapter 3", "Chapter 4"]
 
-        result = split_m4b(
-            test_m4b, output_dir, max_duration_hours=65 / 3600  # Creates 2 parts
-        )
-
-        assert result.success
-        assert len(result.parts) == 2
-
-        # Check chapters in EACH output file
-        for i, output_file in enumerate(result.output_files, 1):
-            chapters = extract_chapters(output_file)
-
-            # Each part should have 2 chapters
-            assert (
-                len(chapters) == 2
-            ), f"Part {i} should have 2 chapters, got {len(chapters)}"
-
-            # First chapter in each part should start at 0
-            assert (
-                chapters[0].start_time == 0.0
-            ), f"Part {i} first chapter doesn't start at 0"
-
-            # Verify chapter titles are correct
-            if i == 1:
-                assert chapters[0].title == "Chapter 1"
-                assert chapters[1].title == "Chapter 2"
-            else:
-                assert chapters[0].title == "Chapter 3"
-                assert chapters[1].title == "Chapter 4"
+        # One smoke probe confirms the chapter atoms really made it into
+        # the container; the per-part wiring above is checked in memory
+        chapters = extract_chapters(result.output_files[0])
+        assert len(chapters) == 2
+        assert chapters[0].start_time == 0.0
+        assert chapters[0].title == "Chapter 1"
+        assert chapters[1].title == "Chapter 2"
 
     def test_split_no_split_needed(self, test_m4b, tmp_path):
         """Test when file is already under max duration."""
         output_dir = tmp_path / "output"
 
-        # File is 2 minutes, set max to 1 hour
+        # File is 8 seconds, set max to 1 hour
         result = split_m4b(test_m4b, output_dir, max_duration_hours=1.0)
 
         assert result.success
@@ -182,7 +162,7 @@ class TestSplitIntegration:
         result = split_m4b(
             test_m4b,
             output_dir,
-            max_duration_hours=65 / 3600,
+            max_duration_hours=4.5 / 3600,
             output_pattern="{artist} - {title} Part {part}.m4b",
         )
 
@@ -199,97 +179,41 @@ class TestIPodModeIntegration:
     """Integration tests for iPod mode."""
 
     @pytest.fixture
-    def test_m4b(self, tmp_path):
-        """Create a test M4B file."""
-        m4b_path = tmp_path / "test.m4b"
-        if create_test_m4b(m4b_path, num_chapters=2, chapter_duration=30.0):
-            return m4b_path
-        pytest.skip("Could not create test M4B file")
-
-    def test_ipod_mode_standard_preset(self, test_m4b, tmp_path):
-        """Test that iPod standard mode re-encodes audio correctly."""
+    def test_m4b(self, m4b_factory):
+        """Shared 2-chapter/2s source file (encoded once per session)."""
+        return m4b_factory(2, 2.0)
+
+    @pytest.mark.parametrize(
+        "preset,channels,sample_rate",
+        [
+            ("standard", 1, "22050"),  # mono at 22050Hz
+            ("high", 2, "44100"),  # stereo at 44100Hz
+            ("video", 1, "44100"),  # iPod Video (5th Gen): mono at 44100Hz
+        ],
+    )
+    def test_ipod_mode_preset(self, test_m4b, tmp_path, preset, channels, sample_rate):
+        """Test that each iPod preset re-encodes audio correctly."""
         output_dir = tmp_path / "output"
 
         result = split_m4b(
             test_m4b,
             output_dir,
-            max_duration_hours=45 / 3600,
+            max_duration_hours=3 / 3600,
             ipod_mode=True,
-            ipod_preset="standard",
+            ipod_preset=preset,
         )
 
         assert result.success
 
         # Check output file properties
-        first_output = result.output_files[0]
-        data = probe_file(first_output)
-
-        audio_stream = None
-        for stream in data.get("streams", []):
-            if stream.get("codec_type") == "audio":
-                audio_stream = stream
-                break
-
-        assert audio_stream is not None
-        # Should be mono at 22050Hz for standard preset
-        assert audio_stream.get("channels") == 1
-        assert audio_stream.get("sample_rate") == "22050"
-
-    def test_ipod_mode_high_preset(self, test_m4b, tmp_path):
-        """Test iPod mode with high quality preset."""
-        output_dir = tmp_path / "output"
-
-        result = split_m4b(
-            test_m4b,
-            output_dir,
-            max_duration_hours=45 / 3600,
-            ipod_mode=True,
-            ipod_preset="high",
+        data = probe_file(result.output_files[0])
+        audio_stream = next(
+            (s for s in data.get("streams", []) if s.get("codec_type") == "audio"), None
         )
 
-        assert result.success
-
-        first_output = result.output_files[0]
-        data = probe_file(first_output)
-
-        audio_stream = None
-        for stream in data.get("streams", []):
-            if stream.get("codec_type") == "audio":
-                audio_stream = stream
-                break
-
         assert audio_stream is not None
-        # Should be stereo at 44100Hz for high preset
-        assert audio_stream.get("channels") == 2
-        assert audio_stream.get("sample_rate") == "44100"
-
-    def test_ipod_mode_video_preset(self, test_m4b, tmp_path):
-        """Test iPod Video (5th Gen) preset."""
-        output_dir = tmp_path / "output"
-
-        result = split_m4b(
-            test_m4b,
-            output_dir,
-            max_duration_hours=45 / 3600,
-            ipod_mode=True,
-            ipod_preset="video",
-        )
-
-        assert result.success
-
-        first_output = result.output_files[0]
-        data = probe_file(first_output)
-
-        audio_stream = None
-        for stream in data.get("streams", []):
-            if stream.get("codec_type") == "audio":
-                audio_stream = stream
-                break
-
-        assert audio_stream is not None
-        # Should be mono at 44100Hz for video preset
-        assert audio_stream.get("channels") == 1
-        assert audio_stream.get("sample_rate") == "44100"
+        assert audio_stream.get("channels") == channels
+        assert audio_stream.get("sample_rate") == sample_rate
 
     def test_ipod_mode_preserves_metadata(self, test_m4b, tmp_path):
         """Test that iPod mode preserves metadata in all parts."""
@@ -298,7 +222,7 @@ class TestIPodModeIntegration:
         result = split_m4b(
             test_m4b,
             output_dir,
-            max_duration_hours=45 / 3600,
+            max_duration_hours=3 / 3600,
             ipod_mode=True,
             ipod_preset="standard",
         )
@@ -318,7 +242,7 @@ class TestIPodModeIntegration:
         result = split_m4b(
             test_m4b,
             output_dir,
-            max_duration_hours=45 / 3600,
+            max_duration_hours=3 / 3600,
             ipod_mode=True,
             ipod_preset="standard",
         )
@@ -336,19 +260,16 @@ class TestSplitterClass:
     """Integration tests for the M4BSplitter class."""
 
     @pytest.fixture
-    def test_m4b(self, tmp_path):
-        """Create a test M4B file."""
-        m4b_path = tmp_path / "test.m4b"
-        if create_test_m4b(m4b_path, num_chapters=4, chapter_duration=30.0):
-            return m4b_path
-        pytest.skip("Could not create test M4B file")
+    def test_m4b(self, m4b_factory):
+        """Shared 4-chapter/2s source file (encoded once per session)."""
+        return m4b_factory(4, 2.0)
 
     def test_splitter_basic(self, test_m4b, tmp_path):
         """Test splitter class directly."""
         output_dir = tmp_path / "output"
 
         splitter = M4BSplitter()
-        result = splitter.split(test_m4b, output_dir, max_duration_hours=65 / 3600)
+        result = splitter.split(test_m4b, output_dir, max_duration_hours=4.5 / 3600)
 
         assert result.success
         assert len(result.parts) == 2
@@ -365,7 +286,7 @@ class TestSplitterClass:
         result = splitter.split(
             test_m4b,
             output_dir,
-            max_duration_hours=65 / 3600,
+            max_duration_hours=4.5 / 3600,
             progress_callback=callback,
         )
 
@@ -381,32 +302,25 @@ class TestSplitterClass:
 class TestEdgeCases:
     """Integration tests for edge cases."""
 
-    def test_single_chapter_file(self, tmp_path):
+    def test_single_chapter_file(self, m4b_factory, tmp_path):
         """Test splitting a file with only one chapter."""
-        m4b_path = tmp_path / "single.m4b"
-        if not create_test_m4b(m4b_path, num_chapters=1, chapter_duration=120.0):
-            pytest.skip("Could not create test M4B file")
-
+        m4b_path = m4b_factory(1, 4.0)
         output_dir = tmp_path / "output"
 
-        # Even with 60s max, can't split a single 120s chapter
-        result = split_m4b(m4b_path, output_dir, max_duration_hours=60 / 3600)
+        # Even with 2s max, can't split a single 4s chapter
+        result = split_m4b(m4b_path, output_dir, max_duration_hours=2 / 3600)
 
         assert result.success
         # Should still create one file with the single chapter
         assert len(result.parts) == 1
 
-    def test_many_small_chapters(self, tmp_path):
-        """Test splitting a file with many small chapters."""
-        m4b_path = tmp_path / "many_chapters.m4b"
-        # 10 chapters of 10 seconds each
-        if not create_test_m4b(m4b_path, num_chapters=10, chapter_duration=10.0):
-            pytest.skip("Could not create test M4B file")
-
+    def test_many_small_chapters(self, m4b_factory, tmp_path):
+        """Test splitting a file with many small chapters (10 x 1s)."""
+        m4b_path = m4b_factory(10, 1.0)
         output_dir = tmp_path / "output"
 
-        # 25 second parts should fit 2 chapters each
-        result = split_m4b(m4b_path, output_dir, max_duration_hours=25 / 3600)
+        # 2.5 second parts should fit 2 chapters each
+        result = split_m4b(m4b_path, output_dir, max_duration_hours=2.5 / 3600)
 
         assert result.success
         # Should have 5 parts with 2 chapters each
@@ -1,12 +1,9 @@
 """Unit tests for the models module."""
 
-import sys
 from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from m4b_splitter.models import AudioMetadata, Chapter, SplitPart, SplitResult
 
 
@@ -21,15 +18,18 @@ class TestChapter:
         assert ch.start_time == 0.0
         assert ch.end_time == 120.0
 
-    def test_chapter_duration(self):
+    @pytest.mark.parametrize(
+        "start,end,duration",
+        [
+            (10.0, 70.0, 60.0),
+            (50.0, 50.0, 0.0),  # zero-length chapter
+            (0.0, 300.0, 300.0),
+        ],
+    )
+    def test_chapter_duration(self, start, end, duration):
         """Test chapter duration calculation."""
-        ch = Chapter(id=0, title="Test", start_time=10.0, end_time=70.0)
-        assert ch.duration == 60.0
-
-    def test_chapter_duration_zero(self):
-        """Test chapter with zero duration."""
-        ch = Chapter(id=0, title="Empty", start_time=50.0, end_time=50.0)
-        assert ch.duration == 0.0
+        ch = Chapter(id=0, title="Test", start_time=start, end_time=end)
+        assert ch.duration == duration
 
     def test_chapter_str_representation(self):
         """Test chapter string representation."""
@@ -126,9 +126,9 @@ class TestAudioMetadata:
 class TestSplitPart:
     """Tests for the SplitPart dataclass."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_chapters(self):
-        """Create sample chapters for testing."""
+        """Create sample chapters for testing (no test mutates them)."""
         return [
             Chapter(id=0, title="Ch1", start_time=0.0, end_time=100.0),
             Chapter(id=1, title="Ch2", start_time=100.0, end_time=250.0),
@@ -147,44 +147,22 @@ class TestSplitPart:
         assert part.total_parts == 3
         assert len(part.chapters) == 3
 
-    def test_split_part_start_time(self, sample_chapters):
-        """Test start time property."""
-        part = SplitPart(
+    @pytest.fixture(scope="class")
+    def default_part(self, sample_chapters):
+        """A prebuilt single-part SplitPart shared by property tests."""
+        return SplitPart(
             part_number=1,
             total_parts=1,
             chapters=sample_chapters,
             output_path=Path("/tmp/test.m4b")
         )
-        assert part.start_time == 0.0
 
-    def test_split_part_end_time(self, sample_chapters):
-        """Test end time property."""
-        part = SplitPart(
-            part_number=1,
-            total_parts=1,
-            chapters=sample_chapters,
-            output_path=Path("/tmp/test.m4b")
-        )
+    def test_split_part_properties(self, default_part):
+        """Test the derived time/title properties on one part."""
+        part = default_part
+        assert part.start_time == 0.0
         assert part.end_time == 400.0
-
-    def test_split_part_duration(self, sample_chapters):
-        """Test duration property."""
-        part = SplitPart(
-            part_number=1,
-            total_parts=1,
-            chapters=sample_chapters,
-            output_path=Path("/tmp/test.m4b")
-        )
         assert part.duration == 400.0
-
-    def test_split_part_chapter_titles(self, sample_chapters):
-        """Test chapter titles property."""
-        part = SplitPart(
-            part_number=1,
-            total_parts=1,
-            chapters=sample_chapters,
-            output_path=Path("/tmp/test.m4b")
-        )
         assert part.chapter_titles == ["Ch1", "Ch2", "Ch3"]
 
     def test_split_part_empty_chapters(self):
@@ -216,9 +194,9 @@ class TestSplitPart:
 class TestSplitResult:
     """Tests for the SplitResult dataclass."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_parts(self):
-        """Create sample parts for testing."""
+        """Create sample parts for testing (no test mutates them)."""
         chapters1 = [Chapter(id=0, title="Ch1", start_time=0.0, end_time=100.0)]
         chapters2 = [Chapter(id=1, title="Ch2", start_time=100.0, end_time=200.0)]
 
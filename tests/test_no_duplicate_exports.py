@@ -0,0 +1,23 @@
+"""Regression tests for the package export surface in __init__.py."""
+
+import inspect
+
+import m4b_splitter
+
+
+class TestExports:
+    """Tests guarding against duplicated or broken re-exports."""
+
+    def test_all_has_no_duplicates(self):
+        """Test that __all__ contains no duplicate entries."""
+        assert len(set(m4b_splitter.__all__)) == len(m4b_splitter.__all__)
+
+    def test_version_assigned_once(self):
+        """Test that __version__ is assigned exactly once in the source."""
+        source = inspect.getsource(m4b_splitter)
+        assert source.count("__version__ = ") == 1
+
+    def test_all_names_resolve(self):
+        """Test that every name in __all__ resolves to an attribute."""
+        for name in m4b_splitter.__all__:
+            assert getattr(m4b_splitter, name) is not None
@@ -0,0 +1,69 @@
+"""Unit tests for the probe module."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from m4b_splitter.models import AudioMetadata
+from m4b_splitter.probe import ProbeError, probe_all
+
+# Minimal ffprobe payload shaped like a valid two-chapter audiobook
+_PROBE_DATA = {
+    "format": {
+        "duration": "120.0",
+        "bit_rate": "64000",
+        "tags": {"title": "Test Book", "artist": "Test Author"},
+    },
+    "streams": [
+        {"codec_type": "audio", "codec_name": "aac", "sample_rate": "22050", "channels": 1}
+    ],
+    "chapters": [
+        {"start_time": "0.0", "end_time": "60.0", "tags": {"title": "Ch1"}},
+        {"start_time": "60.0", "end_time": "120.0", "tags": {"title": "Ch2"}},
+    ],
+}
+
+
+class TestProbeAll:
+    """Tests for the probe_all combined extraction."""
+
+    def test_single_probe_parses_everything(self):
+        """Test that one probe yields chapters, metadata and validity."""
+        with patch("m4b_splitter.probe.probe_file", return_value=_PROBE_DATA) as mock_probe:
+            chapters, metadata, (is_valid, msg) = probe_all(Path("/tmp/book.m4b"))
+
+        mock_probe.assert_called_once()
+        assert [c.title for c in chapters] == ["Ch1", "Ch2"]
+        assert chapters[1].end_time == 120.0
+        assert metadata.title == "Test Book"
+        assert metadata.artist == "Test Author"
+        assert metadata.codec == "aac"
+        assert is_valid
+        assert "2 chapters" in msg
+
+    def test_invalid_extension_short_circuits(self):
+        """Test that a wrong extension is rejected without spawning ffprobe."""
+        with patch("m4b_splitter.probe.probe_file") as mock_probe:
+            chapters, metadata, (is_valid, msg) = probe_all(Path("/tmp/book.txt"))
+
+        mock_probe.assert_not_called()
+        assert chapters == []
+        assert metadata == AudioMetadata()
+        assert not is_valid
+        assert msg == "Invalid file extension: .txt"
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test that a nonexistent file raises ProbeError."""
+        with pytest.raises(ProbeError, match="File not found"):
+            probe_all(tmp_path / "missing.m4b")
+
+    def test_no_chapters_is_invalid(self):
+        """Test that a chapterless file probes fine but fails validation."""
+        data = {"format": {}, "streams": [{"codec_type": "audio"}], "chapters": []}
+        with patch("m4b_splitter.probe.probe_file", return_value=data):
+            chapters, _metadata, (is_valid, msg) = probe_all(Path("/tmp/book.m4b"))
+
+        assert chapters == []
+        assert not is_valid
+        assert "No chapters" in msg
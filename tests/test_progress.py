@@ -1,10 +1,8 @@
 """Unit tests for the progress module."""
 
-import sys
 from io import StringIO
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import pytest
 
 from m4b_splitter.progress import (
     ConsoleProgress,
@@ -59,54 +57,38 @@ class TestProgressUpdate:
         assert update.total == 10
         assert update.detail == "Processing chapter 5"
 
-    def test_percentage_calculation(self):
-        """Test percentage calculation."""
+    @pytest.mark.parametrize(
+        "current,total,expected",
+        [
+            (25, 100, 25.0),
+            (5, 10, 50.0),
+            (10, 10, 100.0),
+            (0, 0, 0.0),  # zero total must not divide
+        ],
+    )
+    def test_percentage(self, current, total, expected):
+        """Test percentage calculation including the zero-total case."""
         update = ProgressUpdate(
             step=ProgressStep.SPLITTING_AUDIO,
             message="Test",
-            current=25,
-            total=100
+            current=current,
+            total=total
         )
-        assert update.percentage == 25.0
-
-    def test_percentage_half(self):
-        """Test percentage at 50%."""
-        update = ProgressUpdate(
-            step=ProgressStep.SPLITTING_AUDIO,
-            message="Test",
-            current=5,
-            total=10
-        )
-        assert update.percentage == 50.0
-
-    def test_percentage_complete(self):
-        """Test percentage at 100%."""
-        update = ProgressUpdate(
-            step=ProgressStep.SPLITTING_AUDIO,
-            message="Test",
-            current=10,
-            total=10
-        )
-        assert update.percentage == 100.0
-
-    def test_percentage_zero_total(self):
-        """Test percentage with zero total."""
-        update = ProgressUpdate(
-            step=ProgressStep.VALIDATING,
-            message="Test",
-            current=0,
-            total=0
-        )
-        assert update.percentage == 0.0
+        assert update.percentage == expected
 
 
 class TestConsoleProgress:
     """Tests for the ConsoleProgress class."""
 
-    def test_console_progress_creation(self):
+    @pytest.fixture
+    def console(self):
+        """A ConsoleProgress writing to a StringIO, as (buffer, progress)."""
+        buf = StringIO()
+        return buf, ConsoleProgress(output=buf)
+
+    def test_console_progress_creation(self, console):
         """Test creating a console progress instance."""
-        output = StringIO()
-        progress = ConsoleProgress(output=output)
+        output, progress = console
         assert progress.output == output
         assert progress.show_progress_bar
         assert progress.bar_width == 40
@@ -121,10 +103,9 @@ class TestConsoleProgress:
         progress = ConsoleProgress(show_progress_bar=False)
         assert not progress.show_progress_bar
 
-    def test_on_progress_simple(self):
+    def test_on_progress_simple(self, console):
         """Test on_progress with simple message."""
-        output = StringIO()
-        progress = ConsoleProgress(output=output)
+        output, progress = console
 
         update = ProgressUpdate(
             step=ProgressStep.VALIDATING,
@@ -136,10 +117,9 @@ class TestConsoleProgress:
         assert "Validating" in result
         assert "Checking file" in result
 
-    def test_on_progress_with_bar(self):
+    def test_on_progress_with_bar(self, console):
         """Test on_progress with progress bar."""
-        output = StringIO()
-        progress = ConsoleProgress(output=output)
+        output, progress = console
 
         update = ProgressUpdate(
             step=ProgressStep.SPLITTING_AUDIO,
@@ -153,10 +133,9 @@ class TestConsoleProgress:
         assert "5/10" in result
         assert "50" in result  # percentage
 
-    def test_on_complete_success(self):
+    def test_on_complete_success(self, console):
         """Test on_complete with success."""
-        output = StringIO()
-        progress = ConsoleProgress(output=output)
+        output, progress = console
 
         progress.on_complete(True, "All done!")
 
@@ -165,10 +144,9 @@ class TestConsoleProgress:
         assert "All done!" in result
         assert "✓" in result
 
-    def test_on_complete_failure(self):
+    def test_on_complete_failure(self, console):
         """Test on_complete with failure."""
-        output = StringIO()
-        progress = ConsoleProgress(output=output)
+        output, progress = console
 
         progress.on_complete(False, "Something failed")
 
@@ -222,6 +200,28 @@ class TestSilentProgress:
         assert isinstance(progress, ProgressCallback)
 
 
+class RecordingCallback(ProgressCallback):
+    """Callback that records every notification it receives.
+
+    Defined once at module scope so the tracker tests don't rebuild a
+    throwaway class per test body.
+    """
+
+    def __init__(self):
+        self.updates = []
+        self.completions = []
+        self.errors = []
+
+    def on_progress(self, update):
+        self.updates.append(update)
+
+    def on_complete(self, success, message):
+        self.completions.append((success, message))
+
+    def on_error(self, error):
+        self.errors.append(error)
+
+
 class TestProgressTracker:
     """Tests for the ProgressTracker class."""
 
@@ -252,19 +252,7 @@ class TestProgressTracker:
     def test_update_notifies_callbacks(self):
         """Test that update notifies all callbacks."""
         tracker = ProgressTracker()
-
-        # Create a mock callback
-        received_updates = []
-
-        class MockCallback(ProgressCallback):
-            def on_progress(self, update):
-                received_updates.append(update)
-            def on_complete(self, success, message):
-                pass
-            def on_error(self, error):
-                pass
-
-        callback = MockCallback()
+        callback = RecordingCallback()
         tracker.add_callback(callback)
 
         tracker.update(
@@ -272,72 +260,81 @@ class TestProgressTracker:
             message="Test message"
         )
 
-        assert len(received_updates) == 1
-        assert received_updates[0].message == "Test message"
+        assert len(callback.updates) == 1
+        assert callback.updates[0].message == "Test message"
 
     def test_complete_notifies_callbacks(self):
         """Test that complete notifies all callbacks."""
         tracker = ProgressTracker()
-
-        completions = []
-
-        class MockCallback(ProgressCallback):
-            def on_progress(self, update):
-                pass
-            def on_complete(self, success, message):
-                completions.append((success, message))
-            def on_error(self, error):
-                pass
-
-        callback = MockCallback()
+        callback = RecordingCallback()
         tracker.add_callback(callback)
 
         tracker.complete(True, "All done")
 
-        assert len(completions) == 1
-        assert completions[0] == (True, "All done")
+        assert callback.completions == [(True, "All done")]
 
     def test_error_notifies_callbacks(self):
         """Test that error notifies all callbacks."""
         tracker = ProgressTracker()
+        callback = RecordingCallback()
+        tracker.add_callback(callback)
 
-        errors = []
+        tracker.error("Something went wrong")
 
-        class MockCallback(ProgressCallback):
-            def on_progress(self, update):
-                pass
-            def on_complete(self, success, message):
-                pass
-            def on_error(self, error):
-                errors.append(error)
+        assert callback.errors == ["Something went wrong"]
 
-        callback = MockCallback()
+    def test_throttled_update_is_stashed_and_flushed_on_complete(self):
+        """Test that a coalesced update is not lost before complete()."""
+        tracker = ProgressTracker()
+        callback = RecordingCallback()
         tracker.add_callback(callback)
 
-        tracker.error("Something went wrong")
+        tracker.update(ProgressStep.SPLITTING_AUDIO, "Encoding", current=1, total=10)
+        # Arrives inside the 50ms window: stashed, not emitted yet
+        tracker.update(ProgressStep.SPLITTING_AUDIO, "Encoding", current=2, total=10)
+        assert [u.current for u in callback.updates] == [1]
 
-        assert len(errors) == 1
-        assert errors[0] == "Something went wrong"
+        tracker.complete(True, "Done")
 
-    def test_multiple_callbacks(self):
-        """Test tracker with multiple callbacks."""
+        assert [u.current for u in callback.updates] == [1, 2]
+        assert callback.completions == [(True, "Done")]
+
+    def test_step_change_flushes_pending_update(self):
+        """Test that a step change emits the stashed update first."""
+        tracker = ProgressTracker()
+        callback = RecordingCallback()
+        tracker.add_callback(callback)
+
+        tracker.update(ProgressStep.SPLITTING_AUDIO, "Encoding", current=1, total=10)
+        tracker.update(ProgressStep.SPLITTING_AUDIO, "Encoding", current=2, total=10)
+        tracker.update(ProgressStep.FINALIZING, "Finalizing")
+
+        assert [(u.step, u.current) for u in callback.updates] == [
+            (ProgressStep.SPLITTING_AUDIO, 1),
+            (ProgressStep.SPLITTING_AUDIO, 2),
+            (ProgressStep.FINALIZING, 0),
+        ]
+
+    def test_final_update_passes_throttle(self):
+        """Test that current == total is emitted immediately."""
         tracker = ProgressTracker()
+        callback = RecordingCallback()
+        tracker.add_callback(callback)
 
-        count = {"updates": 0}
+        tracker.update(ProgressStep.SPLITTING_AUDIO, "Encoding", current=1, total=10)
+        tracker.update(ProgressStep.SPLITTING_AUDIO, "Encoding", current=5, total=10)
+        tracker.update(ProgressStep.SPLITTING_AUDIO, "Encoding", current=10, total=10)
 
-        class CountingCallback(ProgressCallback):
-            def on_progress(self, update):
-                count["updates"] += 1
-            def on_complete(self, success, message):
-                pass
-            def on_error(self, error):
-                pass
+        assert [u.current for u in callback.updates] == [1, 5, 10]
 
-        tracker.add_callback(CountingCallback())
-        tracker.add_callback(CountingCallback())
-        tracker.add_callback(CountingCallback())
+    def test_multiple_callbacks(self):
+        """Test tracker with multiple callbacks."""
+        tracker = ProgressTracker()
+        callbacks = [RecordingCallback() for _ in range(3)]
+        for callback in callbacks:
+            tracker.add_callback(callback)
 
         tracker.update(ProgressStep.VALIDATING, "Test")
 
         # All 3 callbacks should be notified
-        assert count["updates"] == 3
+        assert all(len(callback.updates) == 1 for callback in callbacks)
@@ -1,17 +1,16 @@
 """Unit tests for the splitter module."""
 
-import sys
-from pathlib import Path
+import time
+from unittest.mock import patch
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from m4b_splitter.models import Chapter
+from m4b_splitter.models import AudioMetadata, Chapter
 from m4b_splitter.splitter import (
     IPOD_PRESETS,
     FFmpegProgress,
     IPodSettings,
+    M4BSplitter,
     format_time,
     format_time_human,
     parse_ffmpeg_progress,
@@ -23,86 +22,80 @@ from m4b_splitter.splitter import (
 class TestFormatTime:
     """Tests for the format_time function."""
 
-    def test_format_zero(self):
-        """Test formatting zero seconds."""
-        assert format_time(0) == "00:00:00.000"
-
-    def test_format_seconds_only(self):
-        """Test formatting seconds only."""
-        assert format_time(45.5) == "00:00:45.500"
-
-    def test_format_minutes_and_seconds(self):
-        """Test formatting minutes and seconds."""
-        assert format_time(125.25) == "00:02:05.250"
-
-    def test_format_hours_minutes_seconds(self):
-        """Test formatting with hours."""
-        assert format_time(3661.123) == "01:01:01.123"
-
-    def test_format_large_duration(self):
-        """Test formatting large durations."""
-        # 10 hours, 30 minutes, 45.678 seconds
-        seconds = 10 * 3600 + 30 * 60 + 45.678
-        assert format_time(seconds) == "10:30:45.678"
-
-    def test_format_precision(self):
-        """Test millisecond precision."""
-        assert format_time(1.001) == "00:00:01.001"
-        assert format_time(1.999) == "00:00:01.999"
+    @pytest.mark.parametrize(
+        "seconds,expected",
+        [
+            (0, "00:00:00.000"),
+            (45.5, "00:00:45.500"),
+            (125.25, "00:02:05.250"),
+            (3661.123, "01:01:01.123"),
+            (10 * 3600 + 30 * 60 + 45.678, "10:30:45.678"),
+            # millisecond precision
+            (1.001, "00:00:01.001"),
+            (1.999, "00:00:01.999"),
+        ],
+    )
+    def test_format_time(self, seconds, expected):
+        """Test HH:MM:SS.mmm formatting across magnitudes."""
+        assert format_time(seconds) == expected
 
 
 class TestFormatTimeHuman:
     """Tests for the format_time_human function."""
 
-    def test_format_seconds_only(self):
-        """Test formatting seconds only."""
-        assert format_time_human(30) == "30s"
-        assert format_time_human(59) == "59s"
-
-    def test_format_minutes_and_seconds(self):
-        """Test formatting minutes and seconds."""
-        assert format_time_human(90) == "1m 30s"
-        assert format_time_human(125) == "2m 5s"
-
-    def test_format_hours_minutes_seconds(self):
-        """Test formatting hours, minutes, and seconds."""
-        assert format_time_human(3661) == "1h 1m 1s"
-        assert format_time_human(7200) == "2h 0m 0s"
-
-    def test_format_zero(self):
-        """Test formatting zero seconds."""
-        assert format_time_human(0) == "0s"
+    @pytest.mark.parametrize(
+        "seconds,expected",
+        [
+            (0, "0s"),
+            (30, "30s"),
+            (59, "59s"),
+            (90, "1m 30s"),
+            (125, "2m 5s"),
+            (3661, "1h 1m 1s"),
+            (7200, "2h 0m 0s"),
+        ],
+    )
+    def test_format_time_human(self, seconds, expected):
+        """Test human-readable formatting across magnitudes."""
+        assert format_time_human(seconds) == expected
 
 
 class TestSanitizeFilename:
     """Tests for the sanitize_filename function."""
 
-    def test_clean_filename(self):
-        """Test filename that needs no changes."""
-        assert sanitize_filename("My Audiobook") == "My Audiobook"
-
-    def test_remove_invalid_characters(self):
-        """Test removal of invalid characters."""
-        assert sanitize_filename('Book: Part 1') == "Book_ Part 1"
-        assert sanitize_filename('Book/Part') == "Book_Part"
-        assert sanitize_filename('Book\\Part') == "Book_Part"
-        assert sanitize_filename('Book<>Part') == "Book__Part"
-        assert sanitize_filename('Book"Part') == "Book_Part"
-        assert sanitize_filename('Book|Part') == "Book_Part"
-        assert sanitize_filename('Book?Part') == "Book_Part"
-        assert sanitize_filename('Book*Part') == "Book_Part"
-
-    def test_strip_whitespace_and_dots(self):
-        """Test stripping of leading/trailing whitespace and dots."""
-        assert sanitize_filename("  Book  ") == "Book"
-        assert sanitize_filename("...Book...") == "Book"
-        assert sanitize_filename(". Book .") == "Book"
-
-    def test_empty_string(self):
-        """Test empty string returns 'untitled'."""
-        assert sanitize_filename("") == "untitled"
-        assert sanitize_filename("   ") == "untitled"
-        assert sanitize_filename("...") == "untitled"
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            # clean name passes through
+            ("My Audiobook", "My Audiobook"),
+            # invalid characters become underscores
+            ("Book: Part 1", "Book_ Part 1"),
+            ("Book/Part", "Book_Part"),
+            ("Book\\Part", "Book_Part"),
+            ("Book<>Part", "Book__Part"),
+            ('Book"Part', "Book_Part"),
+            ("Book|Part", "Book_Part"),
+            ("Book?Part", "Book_Part"),
+            ("Book*Part", "Book_Part"),
+            # leading/trailing whitespace and dots stripped
+            ("  Book  ", "Book"),
+            ("...Book...", "Book"),
+            (". Book .", "Book"),
+            # nothing left -> 'untitled'
+            ("", "untitled"),
+            ("   ", "untitled"),
+            ("...", "untitled"),
+            # unicode preserved
+            ("Bücher", "Bücher"),
+            ("日本語", "日本語"),
+            # slashes replaced (important for Part X/Y patterns)
+            ("Part 1/3", "Part 1_3"),
+            ("Book - Part 2/5.m4b", "Book - Part 2_5.m4b"),
+        ],
+    )
+    def test_sanitize(self, name, expected):
+        """Test sanitization of valid, invalid, and edge-case names."""
+        assert sanitize_filename(name) == expected
 
     def test_length_limit(self):
         """Test filename length limiting."""
@@ -110,15 +103,17 @@ class TestSanitizeFilename:
         result = sanitize_filename(long_name)
         assert len(result) == 200
 
-    def test_unicode_characters(self):
-        """Test that unicode characters are preserved."""
-        assert sanitize_filename("Bücher") == "Bücher"
-        assert sanitize_filename("日本語") == "日本語"
 
-    def test_slash_in_pattern(self):
-        """Test that slashes are replaced (important for Part X/Y patterns)."""
-        assert sanitize_filename("Part 1/3") == "Part 1_3"
-        assert sanitize_filename("Book - Part 2/5.m4b") == "Book - Part 2_5.m4b"
+# Canonical chapter runs for TestPlanSplits, built once at import; the
+# planner never mutates its input, so tests share slices of these.
+_CHAPTERS_4 = tuple(
+    Chapter(id=i, title=f"Ch{i + 1}", start_time=i * 100.0, end_time=(i + 1) * 100.0)
+    for i in range(4)
+)
+_CHAPTERS_10 = tuple(
+    Chapter(id=i, title=f"Ch{i + 1}", start_time=i * 60.0, end_time=(i + 1) * 60.0)
+    for i in range(10)
+)
 
 
 class TestPlanSplits:
@@ -131,34 +126,22 @@ class TestPlanSplits:
 
     def test_single_chapter_under_limit(self):
         """Test single chapter under the limit."""
-        chapters = [Chapter(id=0, title="Ch1", start_time=0.0, end_time=100.0)]
-        parts = plan_splits(chapters, max_duration_seconds=3600)
+        parts = plan_splits(list(_CHAPTERS_4[:1]), max_duration_seconds=3600)
 
         assert len(parts) == 1
         assert len(parts[0]) == 1
 
     def test_multiple_chapters_under_limit(self):
         """Test multiple chapters that fit in one part."""
-        chapters = [
-            Chapter(id=0, title="Ch1", start_time=0.0, end_time=100.0),
-            Chapter(id=1, title="Ch2", start_time=100.0, end_time=200.0),
-            Chapter(id=2, title="Ch3", start_time=200.0, end_time=300.0),
-        ]
-        parts = plan_splits(chapters, max_duration_seconds=3600)
+        parts = plan_splits(list(_CHAPTERS_4[:3]), max_duration_seconds=3600)
 
         assert len(parts) == 1
         assert len(parts[0]) == 3
 
     def test_split_into_two_parts(self):
         """Test splitting into exactly two parts."""
-        chapters = [
-            Chapter(id=0, title="Ch1", start_time=0.0, end_time=100.0),
-            Chapter(id=1, title="Ch2", start_time=100.0, end_time=200.0),
-            Chapter(id=2, title="Ch3", start_time=200.0, end_time=300.0),
-            Chapter(id=3, title="Ch4", start_time=300.0, end_time=400.0),
-        ]
         # Max 250s means Ch1+Ch2 (200s) in part 1, Ch3+Ch4 (200s) in part 2
-        parts = plan_splits(chapters, max_duration_seconds=250)
+        parts = plan_splits(list(_CHAPTERS_4), max_duration_seconds=250)
 
         assert len(parts) == 2
         assert len(parts[0]) == 2  # Ch1, Ch2
@@ -166,12 +149,8 @@ class TestPlanSplits:
 
     def test_split_into_multiple_parts(self):
         """Test splitting into multiple parts."""
-        chapters = [
-            Chapter(id=i, title=f"Ch{i+1}", start_time=i*60.0, end_time=(i+1)*60.0)
-            for i in range(10)
-        ]
         # 10 chapters of 60s each, max 150s per part
-        parts = plan_splits(chapters, max_duration_seconds=150)
+        parts = plan_splits(list(_CHAPTERS_10), max_duration_seconds=150)
 
         # Should be 5 parts with 2 chapters each
         assert len(parts) == 5
@@ -241,38 +220,37 @@ class TestFFmpegProgress:
 class TestParseFFmpegProgress:
     """Tests for parse_ffmpeg_progress function."""
 
-    def test_parse_time(self):
-        """Test parsing time from ffmpeg output."""
-        line = "frame=  100 fps=50.0 size=    512kB time=00:01:30.50 bitrate= 128.0kbits/s speed=2.00x"
-        prog = parse_ffmpeg_progress(line, total_duration=180.0)
+    @pytest.mark.parametrize(
+        "line,total,expected",
+        [
+            (
+                "frame=  100 fps=50.0 size=    512kB time=00:01:30.50"
+                " bitrate= 128.0kbits/s speed=2.00x",
+                180.0,
+                {
+                    "time_seconds": pytest.approx(90.5, abs=0.1),
+                    "percent": pytest.approx(50.28, abs=0.5),
+                },
+            ),
+            ("size=  1024kB time=00:01:00.00", 120.0, {"size_kb": 1024}),
+            (
+                "time=00:01:00.00 bitrate= 128.5kbits/s",
+                120.0,
+                {"bitrate_kbps": pytest.approx(128.5, abs=0.1)},
+            ),
+            ("time=00:01:00.00 speed=2.50x", 120.0, {"speed": pytest.approx(2.5, abs=0.1)}),
+            ("time=00:00:30.00", 60.0, {"percent": pytest.approx(50.0, abs=0.1)}),
+            # percentage is capped at 100
+            ("time=00:02:00.00", 60.0, {"percent": 100.0}),
+        ],
+    )
+    def test_parse_fields(self, line, total, expected):
+        """Test that each stats field is parsed from representative lines."""
+        prog = parse_ffmpeg_progress(line, total_duration=total)
 
         assert prog is not None
-        assert prog.time_seconds == pytest.approx(90.5, abs=0.1)
-        assert prog.percent == pytest.approx(50.28, abs=0.5)
-
-    def test_parse_size(self):
-        """Test parsing size from ffmpeg output."""
-        line = "size=  1024kB time=00:01:00.00"
-        prog = parse_ffmpeg_progress(line, total_duration=120.0)
-
-        assert prog is not None
-        assert prog.size_kb == 1024
-
-    def test_parse_bitrate(self):
-        """Test parsing bitrate from ffmpeg output."""
-        line = "time=00:01:00.00 bitrate= 128.5kbits/s"
-        prog = parse_ffmpeg_progress(line, total_duration=120.0)
-
-        assert prog is not None
-        assert prog.bitrate_kbps == pytest.approx(128.5, abs=0.1)
-
-    def test_parse_speed(self):
-        """Test parsing speed from ffmpeg output."""
-        line = "time=00:01:00.00 speed=2.50x"
-        prog = parse_ffmpeg_progress(line, total_duration=120.0)
-
-        assert prog is not None
-        assert prog.speed == pytest.approx(2.5, abs=0.1)
+        for attr, value in expected.items():
+            assert getattr(prog, attr) == value
 
     def test_no_time_returns_none(self):
         """Test that lines without time= return None."""
@@ -281,22 +259,6 @@ class TestParseFFmpegProgress:
 
         assert prog is None
 
-    def test_percent_calculation(self):
-        """Test percentage calculation."""
-        line = "time=00:00:30.00"
-        prog = parse_ffmpeg_progress(line, total_duration=60.0)
-
-        assert prog is not None
-        assert prog.percent == pytest.approx(50.0, abs=0.1)
-
-    def test_percent_capped_at_100(self):
-        """Test that percentage doesn't exceed 100."""
-        line = "time=00:02:00.00"
-        prog = parse_ffmpeg_progress(line, total_duration=60.0)
-
-        assert prog is not None
-        assert prog.percent == 100.0
-
 
 class TestIPodSettings:
     """Tests for the IPodSettings dataclass."""
@@ -443,3 +405,196 @@ class TestIPodPresets:
         # Video should use CBR
         assert video.use_cbr
         assert not standard.use_cbr
+
+
+class TestSplitJobs:
+    """Tests for parallel part encoding in M4BSplitter.split.
+
+    split_audio_segment is stubbed out so these exercise the worker
+    pool, ordering and thread-budget logic without ffmpeg.
+    """
+
+    def _run_split(self, tmp_path, jobs, cpus=4, fail_start=None, stagger=False):
+        """Drive split() over 10 fake 60s chapters with a stubbed encoder.
+
+        Returns (result, calls) where calls records the start_time and
+        ffmpeg_threads of every stubbed split_audio_segment invocation.
+        """
+        chapters = [
+            Chapter(id=i, title=f"Ch{i + 1}", start_time=i * 60.0, end_time=(i + 1) * 60.0)
+            for i in range(10)
+        ]
+        metadata = AudioMetadata(title="Test Book", artist="Test Author", duration=600.0)
+        probe_result = (chapters, metadata, (True, "Valid M4B file with 10 chapters"))
+
+        calls = []
+
+        def fake_segment(
+            input_file,
+            output_file,
+            start_time,
+            end_time,
+            metadata_file,
+            cover_file=None,
+            ipod_settings=None,
+            progress_callback=None,
+            ffmpeg_threads=0,
+            hwaccel=None,
+        ):
+            # Optionally let the first part finish last so as_completed
+            # yields parts out of order
+            if stagger and start_time == 0.0:
+                time.sleep(0.05)
+            calls.append({"start": start_time, "threads": ffmpeg_threads})
+            if fail_start is not None and start_time == fail_start:
+                return False, "encoder exploded"
+            output_file.touch()
+            return True, ""
+
+        with (
+            patch("m4b_splitter.splitter.probe_all", return_value=probe_result),
+            patch("m4b_splitter.splitter.extract_cover_art", return_value=False),
+            patch("m4b_splitter.splitter.split_audio_segment", side_effect=fake_segment),
+            patch("m4b_splitter.splitter._available_cpus", return_value=cpus),
+        ):
+            result = M4BSplitter().split(
+                tmp_path / "book.m4b",
+                tmp_path / "out",
+                max_duration_hours=150 / 3600,  # 5 parts of 2 chapters
+                jobs=jobs,
+            )
+        return result, calls
+
+    def test_parallel_parts_complete_and_ordered(self, tmp_path):
+        """Test that jobs=2 yields all parts sorted despite completion order."""
+        result, calls = self._run_split(tmp_path, jobs=2, stagger=True)
+
+        assert result.success
+        assert len(calls) == 5
+        assert [part.part_number for part in result.parts] == [1, 2, 3, 4, 5]
+        for part in result.parts:
+            assert len(part.chapters) == 2
+            assert part.output_path.exists()
+
+    def test_jobs_zero_auto_sizes_to_cpus(self, tmp_path):
+        """Test that jobs=0 sizes the pool from the CPU count."""
+        result, calls = self._run_split(tmp_path, jobs=0, cpus=4)
+
+        assert result.success
+        # 4 workers (clamped below the 5 parts) share 4 cores -> 1 thread each
+        assert all(call["threads"] == 1 for call in calls)
+
+    def test_thread_budget_divided_between_workers(self, tmp_path):
+        """Test that each worker's ffmpeg gets cores // workers threads."""
+        result, calls = self._run_split(tmp_path, jobs=2, cpus=8)
+
+        assert result.success
+        assert all(call["threads"] == 4 for call in calls)
+
+    def test_serial_run_keeps_ffmpeg_thread_auto(self, tmp_path):
+        """Test that jobs=1 leaves ffmpeg's own thread sizing alone."""
+        result, calls = self._run_split(tmp_path, jobs=1, cpus=8)
+
+        assert result.success
+        assert all(call["threads"] == 0 for call in calls)
+
+    def test_failed_worker_fails_the_split(self, tmp_path):
+        """Test that one failed part surfaces as an unsuccessful result."""
+        result, _calls = self._run_split(tmp_path, jobs=2, fail_start=240.0)
+
+        assert not result.success
+        assert "Failed to create part 3" in result.error_message
+        assert "encoder exploded" in result.error_message
+
+
+class TestIPodStreamCopyMatch:
+    """Tests for the preset-match stream-copy shortcut in split().
+
+    When the source stream already satisfies the chosen iPod preset,
+    split() drops ipod_settings and stream-copies instead of
+    re-encoding; a wrong predicate here changes the output encoding.
+    """
+
+    def _run_ipod_split(self, tmp_path, metadata):
+        """Run an ipod_mode split with stubs; returns the ipod_settings
+        values the stubbed encoder received (one per part)."""
+        chapters = [
+            Chapter(id=i, title=f"Ch{i + 1}", start_time=i * 60.0, end_time=(i + 1) * 60.0)
+            for i in range(4)
+        ]
+        probe_result = (chapters, metadata, (True, "Valid M4B file with 4 chapters"))
+
+        seen_settings = []
+
+        def fake_segment(
+            input_file,
+            output_file,
+            start_time,
+            end_time,
+            metadata_file,
+            cover_file=None,
+            ipod_settings=None,
+            progress_callback=None,
+            ffmpeg_threads=0,
+            hwaccel=None,
+        ):
+            seen_settings.append(ipod_settings)
+            output_file.touch()
+            return True, ""
+
+        with (
+            patch("m4b_splitter.splitter.probe_all", return_value=probe_result),
+            patch("m4b_splitter.splitter.extract_cover_art", return_value=False),
+            patch("m4b_splitter.splitter.split_audio_segment", side_effect=fake_segment),
+        ):
+            result = M4BSplitter().split(
+                tmp_path / "book.m4b",
+                tmp_path / "out",
+                max_duration_hours=120 / 3600,  # 2 parts of 2 chapters
+                ipod_mode=True,
+                ipod_preset="standard",
+            )
+        assert result.success
+        return seen_settings
+
+    @staticmethod
+    def _metadata(**overrides):
+        """Metadata that exactly matches the 'standard' preset by default."""
+        fields = {
+            "title": "Test Book",
+            "artist": "Test Author",
+            "duration": 240.0,
+            "codec": "aac",
+            "sample_rate": 22050,
+            "channels": 1,
+            "bit_rate": 64000,
+        }
+        fields.update(overrides)
+        return AudioMetadata(**fields)
+
+    def test_matching_source_uses_stream_copy(self, tmp_path):
+        """Test that a preset-matching source nulls out ipod_settings."""
+        seen = self._run_ipod_split(tmp_path, self._metadata())
+
+        assert seen == [None, None]
+
+    def test_close_bitrate_still_matches(self, tmp_path):
+        """Test that a bitrate within the 8kbps tolerance still matches."""
+        seen = self._run_ipod_split(tmp_path, self._metadata(bit_rate=70000))
+
+        assert seen == [None, None]
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"codec": "mp3"},
+            {"sample_rate": 44100},
+            {"channels": 2},
+            {"bit_rate": 128000},
+        ],
+    )
+    def test_mismatched_source_still_reencodes(self, tmp_path, overrides):
+        """Test that any predicate miss keeps the re-encode settings."""
+        seen = self._run_ipod_split(tmp_path, self._metadata(**overrides))
+
+        assert all(settings is IPOD_PRESETS["standard"] for settings in seen)
@@ -9,6 +9,7 @@ def create_test_m4b(
     chapter_duration: float = 60.0,
     title: str = "Test Audiobook",
     artist: str = "Test Author",
+    ffmpeg_bin: str = "ffmpeg",
 ) -> bool:
     """
     Create a test M4B file with chapters.
@@ -19,6 +20,9 @@ def create_test_m4b(
         chapter_duration: Duration of each chapter in seconds.
         title: Book title.
         artist: Author name.
+        ffmpeg_bin: ffmpeg executable; pass an absolute path (e.g. the
+            one check_dependencies already resolved) to skip the PATH
+            search on each spawn.
 
     Returns:
         True if successful.
@@ -26,68 +30,67 @@ def create_test_m4b(
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
 
-        # Create silence audio
         total_duration = num_chapters * chapter_duration
-        audio_file = temp_path / "audio.m4a"
 
+        # Create metadata file with chapters, built in memory and written
+        # in one call (same pattern as splitter.create_metadata_file)
+        metadata_file = temp_path / "metadata.txt"
+        parts = [
+            ";FFMETADATA1\n",
+            f"title={title}\n",
+            f"artist={artist}\n",
+            "album=Test Album\n",
+            "genre=Audiobook\n",
+        ]
+        parts.extend(
+            f"\n[CHAPTER]\nTIMEBASE=1/1000\n"
+            f"START={int(i * chapter_duration * 1000)}\n"
+            f"END={int((i + 1) * chapter_duration * 1000)}\n"
+            f"title=Chapter {i + 1}\n"
+            for i in range(num_chapters)
+        )
+        metadata_file.write_text("".join(parts))
+
+        # One ffmpeg pass: encode silence and attach metadata/chapters in
+        # the same invocation instead of encoding to an intermediate .m4a
+        # and remuxing it
         cmd = [
-            "ffmpeg",
+            ffmpeg_bin,
             "-y",
+            "-loglevel",
+            "error",
+            "-nostats",
             "-f",
             "lavfi",
             "-i",
             "anullsrc=r=44100:cl=mono",
-            "-t",
-            str(total_duration),
-            "-c:a",
-            "aac",
-            "-b:a",
-            "64k",
-            str(audio_file),
-        ]
-
-        result = subprocess.run(cmd, check=False, capture_output=True)
-        if result.returncode != 0:
-            return False
-
-        # Create metadata file with chapters
-        metadata_file = temp_path / "metadata.txt"
-        with metadata_file.open("w") as f:
-            f.write(";FFMETADATA1\n")
-            f.write(f"title={title}\n")
-            f.write(f"artist={artist}\n")
-            f.write("album=Test Album\n")
-            f.write("genre=Audiobook\n")
-
-            for i in range(num_chapters):
-                start_ms = int(i * chapter_duration * 1000)
-                end_ms = int((i + 1) * chapter_duration * 1000)
-                f.write("\n[CHAPTER]\n")
-                f.write("TIMEBASE=1/1000\n")
-                f.write(f"START={start_ms}\n")
-                f.write(f"END={end_ms}\n")
-                f.write(f"title=Chapter {i + 1}\n")
-
-        # Combine audio with metadata
-        cmd = [
-            "ffmpeg",
-            "-y",
-            "-i",
-            str(audio_file),
             "-i",
             str(metadata_file),
+            "-t",
+            str(total_duration),
             "-map",
             "0:a",
             "-map_metadata",
             "1",
             "-map_chapters",
             "1",
-            "-c",
-            "copy",
+            "-c:a",
+            "aac",
+            "-b:a",
+            "64k",
+            # One encoder thread: under pytest-xdist several of these run
+            # at once and shouldn't oversubscribe the cores
+            "-threads",
+            "1",
             "-f",
             "ipod",
             str(output_path),
         ]
 
-        result = subprocess.run(cmd, check=False, capture_output=True)
+        result = subprocess.run(
+            cmd,
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
         return result.returncode == 0 and output_path.exists()